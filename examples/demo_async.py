@@ -0,0 +1,56 @@
+"""
+Demo script for the asynchronous SDK client.
+Demonstrates running independent requests concurrently with asyncio.gather.
+"""
+
+import asyncio
+
+from sharpai_sdk import aconfigure, aget_client, Ollama, OpenAI
+
+# Configure the SDK's async client
+aconfigure(
+    endpoint="http://localhost:8000",
+    timeout=30,
+    retries=3,
+)
+
+
+async def main():
+    """Issue independent requests concurrently."""
+    print("\n1. Generating embeddings and a chat completion concurrently...")
+    try:
+        ollama_embedding, openai_embedding, chat = await asyncio.gather(
+            Ollama.agenerate_embedding(
+                model="leliuga/all-MiniLM-L6-v2-GGUF",
+                input_data="Hello, SharpAI!",
+            ),
+            OpenAI.acreate_embedding(
+                model="leliuga/all-MiniLM-L6-v2-GGUF",
+                input_data="Hello, SharpAI!",
+            ),
+            OpenAI.acreate_chat_completion(
+                model="QuantFactory/Qwen2.5-3B-GGUF",
+                messages=[{"role": "user", "content": "What is Python?"}],
+                max_tokens=100,
+            ),
+        )
+        if ollama_embedding.embedding:
+            print(f"Ollama embedding: {len(ollama_embedding.embedding)} dimensions")
+        print(f"OpenAI embeddings: {len(openai_embedding.data)}")
+        if chat.choices:
+            print(f"Chat response: {chat.choices[0].message.content[:200]}...")
+    except Exception as e:
+        print(f"Error running concurrent requests: {e}")
+    finally:
+        await aget_client().close()
+
+
+print("=" * 60)
+print("Async API Demo")
+print("=" * 60)
+
+asyncio.run(main())
+
+print("\n" + "=" * 60)
+print("Demo completed!")
+print("=" * 60)
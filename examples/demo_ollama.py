@@ -63,17 +63,20 @@ def generate_completion():
     """Generate a completion."""
     print("\n4. Generating a completion...")
     try:
-        generate_response = Ollama.generate(
+        chunks = Ollama.generate(
             model="QuantFactory/Qwen2.5-3B-GGUF",
             prompt="why is the sky blue",
-            stream=False,
+            stream=True,
             options={
                 "num_predict": 100,
                 "temperature": 0.8,
             },
         )
-        if generate_response.response:
-            print(f"Generated response: {generate_response.response[:200]}...")
+        print("Generated response: ", end="")
+        for chunk in chunks:
+            if chunk.response:
+                print(chunk.response, end="", flush=True)
+        print()
     except Exception as e:
         print(f"Error generating completion: {e}")
 
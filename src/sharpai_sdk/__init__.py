@@ -17,8 +17,10 @@ except PackageNotFoundError:  # pragma: no cover
 finally:
     del version, PackageNotFoundError
 
+from .async_base import AsyncBaseClient
 from .base import BaseClient
-from .configuration import configure, get_client
+from .cache import EmbeddingCache, InMemoryEmbeddingCache
+from .configuration import aconfigure, aget_client, configure, get_client
 from .enums.enumeration_order_enum import EnumerationOrder_Enum
 from .enums.operator_enum import Opertator_Enum
 from .exceptions import (
@@ -42,8 +44,13 @@ from .resources import Connectivity, Ollama, OpenAI
 __all__ = [
     "__version__",
     "BaseClient",
+    "AsyncBaseClient",
     "configure",
     "get_client",
+    "aconfigure",
+    "aget_client",
+    "EmbeddingCache",
+    "InMemoryEmbeddingCache",
     "EnumerationOrder_Enum",
     "Opertator_Enum",
     "ExprModel",
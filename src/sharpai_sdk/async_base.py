@@ -0,0 +1,122 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from .base import BaseClient
+from .enums.severity_enum import Severity_Enum
+from .exceptions import SdkException
+from .sdk_logging import log_error, log_info
+
+
+class AsyncBaseClient(BaseClient):
+    """
+    SharpAI SDK asynchronous base client class.
+    Mirrors BaseClient on top of httpx.AsyncClient so independent requests can be
+    awaited concurrently (e.g. with asyncio.gather). A user supplied `httpx_client`
+    must be an httpx.AsyncClient.
+    """
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The underlying asynchronous HTTP client.
+        Built on first use and reused for every request.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                    )
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        raw_json: Optional[bytes] = None,
+        raise_for_status: bool = True,
+        decode: bool = True,
+        **kwargs,
+    ):
+        """
+        Make an asynchronous HTTP request to the API with automatic retries and error handling.
+
+        Args:
+            method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
+            url (str): The URL to send the request to.
+            raw_json (bytes, optional): An already serialized JSON body, sent as is.
+            raise_for_status (bool): When False, the raw httpx.Response is returned
+                whatever its status code, instead of raising for error statuses.
+            decode (bool): When False, the response body is returned as raw bytes
+                instead of being parsed as JSON, for callers with their own decoder.
+            **kwargs: Additional arguments to pass to the underlying httpx request.
+                - headers (dict, optional): Additional headers for the request.
+                - data (dict, optional): The data to be sent in the request body.
+
+        Returns:
+            dict: The JSON response from the API if the response has content, None otherwise.
+
+        Raises:
+            SdkException: If the request fails after all retries.
+            Various exceptions from get_exception_for_error_code based on the API error response.
+        """
+        kwargs = self._prepare_request(method, url, kwargs, raw_json)
+
+        for attempt in range(self.retries):
+            try:
+                response = await self.client.request(method, url, **kwargs)
+                if not raise_for_status:
+                    return response
+                return self._handle_response(response, decode)
+
+            except httpx.HTTPStatusError as e:
+                self._handle_status_error(e)
+
+            except httpx.RequestError as e:
+                self._handle_request_error(e, attempt)
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Make an asynchronous streaming HTTP request to the API.
+        The response body is not read up front, so callers can consume chunks
+        (e.g. with `response.aiter_lines()`) as the server produces them.
+        Streaming requests are not retried, since a partially consumed body cannot be replayed.
+
+        Args:
+            method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
+            url (str): The URL to send the request to.
+            **kwargs: Additional arguments to pass to the underlying httpx request.
+
+        Yields:
+            httpx.Response: The open streaming response.
+
+        Raises:
+            SdkException: If the request fails.
+            Various exceptions from get_exception_for_error_code based on the API error response.
+        """
+        kwargs = self._prepare_request(method, url, kwargs)
+        try:
+            async with self.client.stream(method, url, **kwargs) as response:
+                if response.is_error:
+                    await response.aread()
+                    self._check_stream_response(response)
+                yield response
+        except httpx.RequestError as e:
+            log_error(Severity_Enum.Error.value, f"Streaming request failed: {e}")
+            raise SdkException(f"Streaming request failed: {e}")
+
+    async def close(self):
+        """
+        Close the asynchronous HTTP client.
+        """
+        log_info(Severity_Enum.Info.value, "Closing async HTTP Client")
+        if self._client is not None:
+            await self._client.aclose()
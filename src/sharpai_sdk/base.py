@@ -1,5 +1,6 @@
-import json
-from typing import TypeVar
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, TypeVar
 
 import httpx
 
@@ -7,6 +8,7 @@ from .enums.severity_enum import Severity_Enum
 from .exceptions import SdkException, get_exception_for_error_code
 from .models.api_error import ApiErrorResponseModel
 from .sdk_logging import log_error, log_info, log_warning
+from .utils.json_helper import _json_dumps, _json_loads
 
 T = TypeVar("T", bound="BaseClient")
 
@@ -22,19 +24,55 @@ class BaseClient:
         base_url: str,
         timeout: int = 10,
         retries: int = 3,
+        max_keepalive_connections: int = 20,
+        max_connections: int = 100,
+        keepalive_expiry: float = 30.0,
+        httpx_client: Optional[httpx.Client] = None,
+        http2: bool = False,
     ):
         self.base_url = base_url
         self.timeout = timeout
         self.retries = retries
-        self.client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        self.limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._client = httpx_client
+        self._client_lock = threading.Lock()
 
         log_info(
             Severity_Enum.Info.value,
             f"BaseClient initialized with base_url: {self.base_url}, "
             f"timeout: {self.timeout}, "
-            f"retries: {self.retries}",
+            f"retries: {self.retries}, "
+            f"max_keepalive_connections: {max_keepalive_connections}, "
+            f"max_connections: {max_connections}, "
+            f"keepalive_expiry: {keepalive_expiry}, "
+            f"http2: {http2}",
         )
 
+    @property
+    def client(self) -> httpx.Client:
+        """
+        The underlying HTTP client.
+        Built on first use and reused for every request so that pooled keep-alive
+        connections are shared instead of paying a new handshake per call.
+        Batched requests read it from several threads, so the build is locked to
+        make sure only one client is ever created.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                    )
+        return self._client
+
     def _get_headers(self):
         """
         Generate the default headers for API requests.
@@ -43,21 +81,26 @@ class BaseClient:
         headers = {"Content-Type": "application/json"}
         return headers
 
-    def _handle_response(self, response):
+    def _handle_response(self, response, decode: bool = True):
         """Handle successful API response."""
         response.raise_for_status()
         log_info(
             Severity_Enum.Info.value, f"Request successful: {response.status_code}"
         )
+        content = response.content
+        if not decode:
+            return content
         try:
-            return response.json() if response.content else None
-        except (json.JSONDecodeError, ValueError):
-            return response.content
+            return _json_loads(content) if content else None
+        except ValueError:
+            return content
 
     def _handle_error_response(self, error):
         """Handle HTTP error response."""
         if error.response.headers.get("Content-Type") == "application/json":
-            error_response = ApiErrorResponseModel(**error.response.json())
+            error_response = ApiErrorResponseModel(
+                **_json_loads(error.response.content)
+            )
             log_error(
                 Severity_Enum.Error.value,
                 f"Error response: {error_response.error.value} - {error_response.description}",
@@ -69,13 +112,73 @@ class BaseClient:
         )
         raise SdkException("Server responded with non-JSON content")
 
-    def request(self, method: str, url: str, **kwargs):
+    def _prepare_request(
+        self, method: str, url: str, kwargs: dict, raw_json: Optional[bytes] = None
+    ) -> dict:
+        """
+        Merge the default headers and serialized body into the request arguments.
+        A `json` body is serialized here with `_json_dumps` (orjson when installed)
+        instead of by httpx with the standard library.
+        """
+        if raw_json is None and kwargs.get("json") is not None:
+            raw_json = _json_dumps(kwargs.pop("json"))
+        if raw_json is not None:
+            kwargs["content"] = raw_json
+        headers = self._get_headers()
+        if "headers" in kwargs:
+            headers.update(kwargs["headers"])
+        kwargs["headers"] = headers
+
+        log_info(
+            Severity_Enum.Info.value,
+            f"Making {method} request to {url} with headers: {headers}",
+        )
+        return kwargs
+
+    def _handle_status_error(self, error: httpx.HTTPStatusError):
+        """Raise the SDK exception matching an HTTP error status."""
+        try:
+            self._handle_error_response(error)
+        except ValueError:
+            log_error(
+                Severity_Enum.Error.value,
+                f"Unexpected error while parsing error Response: {error}",
+            )
+            raise SdkException(f"Unexpected error: {error}")
+
+    def _handle_request_error(self, error: httpx.RequestError, attempt: int):
+        """Log a failed attempt, raising once all retries are exhausted."""
+        if attempt == self.retries - 1:
+            log_error(
+                Severity_Enum.Error.value,
+                "Max retries reached. Failing request.",
+            )
+            raise SdkException(f"Request failed after {self.retries} attempts: {error}")
+        log_warning(
+            Severity_Enum.Warn.value,
+            f"Request attempt {attempt + 1} failed: {error}",
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        raw_json: Optional[bytes] = None,
+        raise_for_status: bool = True,
+        decode: bool = True,
+        **kwargs,
+    ):
         """
         Make an HTTP request to the API with automatic retries and error handling.
 
         Args:
             method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
             url (str): The URL to send the request to.
+            raw_json (bytes, optional): An already serialized JSON body, sent as is.
+            raise_for_status (bool): When False, the raw httpx.Response is returned
+                whatever its status code, instead of raising for error statuses.
+            decode (bool): When False, the response body is returned as raw bytes
+                instead of being parsed as JSON, for callers with their own decoder.
             **kwargs: Additional arguments to pass to the underlying httpx request.
                 - headers (dict, optional): Additional headers for the request.
                 - data (dict, optional): The data to be sent in the request body.
@@ -87,48 +190,63 @@ class BaseClient:
             SdkException: If the request fails after all retries.
             Various exceptions from get_exception_for_error_code based on the API error response.
         """
-        headers = self._get_headers()
-        if "headers" in kwargs:
-            headers.update(kwargs["headers"])
-        kwargs["headers"] = headers
-
-        log_info(
-            Severity_Enum.Info.value,
-            f"Making {method} request to {url} with headers: {headers}",
-        )
+        kwargs = self._prepare_request(method, url, kwargs, raw_json)
 
         for attempt in range(self.retries):
             try:
                 response = self.client.request(method, url, **kwargs)
-                return self._handle_response(response)
+                if not raise_for_status:
+                    return response
+                return self._handle_response(response, decode)
 
             except httpx.HTTPStatusError as e:
-                try:
-                    self._handle_error_response(e)
-                except ValueError:
-                    log_error(
-                        Severity_Enum.Error.value,
-                        f"Unexpected error while parsing error Response: {e}",
-                    )
-                    raise SdkException(f"Unexpected error: {e}")
+                self._handle_status_error(e)
 
             except httpx.RequestError as e:
-                if attempt == self.retries - 1:
-                    log_error(
-                        Severity_Enum.Error.value,
-                        "Max retries reached. Failing request.",
-                    )
-                    raise SdkException(
-                        f"Request failed after {self.retries} attempts: {e}"
-                    )
-                log_warning(
-                    Severity_Enum.Warn.value,
-                    f"Request attempt {attempt + 1} failed: {e}",
-                )
+                self._handle_request_error(e, attempt)
+
+    def _check_stream_response(self, response: httpx.Response):
+        """Raise the SDK exception for an already read streaming error response."""
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            self._handle_status_error(e)
+
+    @contextmanager
+    def stream(self, method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+        """
+        Make a streaming HTTP request to the API.
+        The response body is not read up front, so callers can consume chunks
+        (e.g. with `response.iter_lines()`) as the server produces them.
+        Streaming requests are not retried, since a partially consumed body cannot be replayed.
+
+        Args:
+            method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
+            url (str): The URL to send the request to.
+            **kwargs: Additional arguments to pass to the underlying httpx request.
+
+        Yields:
+            httpx.Response: The open streaming response.
+
+        Raises:
+            SdkException: If the request fails.
+            Various exceptions from get_exception_for_error_code based on the API error response.
+        """
+        kwargs = self._prepare_request(method, url, kwargs)
+        try:
+            with self.client.stream(method, url, **kwargs) as response:
+                if response.is_error:
+                    response.read()
+                    self._check_stream_response(response)
+                yield response
+        except httpx.RequestError as e:
+            log_error(Severity_Enum.Error.value, f"Streaming request failed: {e}")
+            raise SdkException(f"Streaming request failed: {e}")
 
     def close(self):
         """
         Close the HTTP client.
         """
         log_info(Severity_Enum.Info.value, "Closing HTTP Client")
-        self.client.close()
+        if self._client is not None:
+            self._client.close()
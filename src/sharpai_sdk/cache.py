@@ -0,0 +1,254 @@
+import string
+import struct
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from hashlib import blake2b
+from typing import Dict, List, Optional, Protocol, Sequence, Set, Tuple
+
+from .exceptions import SdkException
+
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# XOR masks deriving the MinHash permutations from a single 64-bit shingle hash.
+_MINHASH_MASKS = (
+    0x0000000000000000,
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+)
+_SHINGLE_SIZE = 3
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase `text`, strip punctuation and collapse whitespace."""
+    return " ".join(text.lower().translate(_PUNCT_TABLE).split())
+
+
+def _minhash(text: str) -> Tuple[int, ...]:
+    """Return one MinHash value per permutation over the character shingles of `text`."""
+    shingles = {
+        text[i : i + _SHINGLE_SIZE]
+        for i in range(max(len(text) - _SHINGLE_SIZE + 1, 1))
+    }
+    hashes = [
+        int.from_bytes(blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+        for s in shingles
+    ]
+    return tuple(min(h ^ mask for h in hashes) for mask in _MINHASH_MASKS)
+
+
+class EmbeddingCache(Protocol):
+    """Interface for caches that store embedding vectors per model and input text."""
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Return the cached embedding for `text`, or None on a miss."""
+        ...
+
+    def set(self, model: str, text: str, embedding: List[float]) -> None:
+        """Store the embedding for `text`."""
+        ...
+
+
+class InMemoryEmbeddingCache:
+    """
+    Thread-safe in-process LRU cache of embedding vectors.
+    Keys are `(model, blake2b(text))`, so long inputs are not kept in memory. Vectors
+    are stored as packed floats, bounded by their total size in bytes.
+    """
+
+    _TYPECODES = {"float64": "d", "float32": "f", "float16": "e"}
+    FUZZY_MAX_LENGTH = 256
+
+    def __init__(
+        self,
+        max_bytes: int = 128 * 1024 * 1024,
+        maxsize: Optional[int] = None,
+        dtype: str = "float64",
+        normalize: bool = False,
+        fuzzy_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes (int): Maximum total size of the stored vectors before the least
+                recently used ones are evicted. Default is 128 MiB.
+            maxsize (int, optional): Maximum number of embeddings kept. Unbounded by
+                default.
+            dtype (str): Storage precision: "float64" returns vectors exactly as
+                received, "float32" and "float16" store 2x and 4x more vectors in the
+                same budget at reduced precision (float16 keeps about three significant
+                digits). Default is "float64".
+            normalize (bool): Key entries on the lowercased text with punctuation
+                removed and whitespace collapsed, so "Hello, SharpAI!" and
+                "hello sharpai" share an entry. Default is False.
+            fuzzy_threshold (float, optional): When set, a miss on an input of at most
+                `FUZZY_MAX_LENGTH` characters returns the vector of the most similar
+                cached input of the same model whose `difflib` similarity ratio is at
+                least this value (0 to 1, e.g. 0.97). Candidates are preselected by
+                MinHash, so the lookup does not scan the whole cache. Disabled by
+                default.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        if dtype not in self._TYPECODES:
+            raise ValueError(f"dtype must be one of {sorted(self._TYPECODES)}")
+        if fuzzy_threshold is not None and not 0 < fuzzy_threshold <= 1:
+            raise ValueError("fuzzy_threshold must be between 0 and 1")
+        self.max_bytes = max_bytes
+        self.maxsize = maxsize
+        self.dtype = dtype
+        self.normalize = normalize
+        self.fuzzy_threshold = fuzzy_threshold
+        self._typecode = self._TYPECODES[dtype]
+        self._data: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Fuzzy tier: text and MinHash of short entries, and the MinHash buckets.
+        self._fuzzy: Dict[Tuple[str, bytes], Tuple[str, Tuple[int, ...]]] = {}
+        self._buckets: Dict[Tuple[str, int, int], Set[Tuple[str, bytes]]] = {}
+
+    @staticmethod
+    def _key(model: str, text: str) -> Tuple[str, bytes]:
+        return model, blake2b(text.encode("utf-8")).digest()
+
+    def _is_fuzzy(self, text: str) -> bool:
+        return self.fuzzy_threshold is not None and len(text) <= self.FUZZY_MAX_LENGTH
+
+    def _index(self, key: Tuple[str, bytes], text: str) -> None:
+        signature = _minhash(text)
+        self._fuzzy[key] = (text, signature)
+        for band, value in enumerate(signature):
+            self._buckets.setdefault((key[0], band, value), set()).add(key)
+
+    def _unindex(self, key: Tuple[str, bytes]) -> None:
+        entry = self._fuzzy.pop(key, None)
+        if entry is None:
+            return
+        for band, value in enumerate(entry[1]):
+            bucket_key = (key[0], band, value)
+            bucket = self._buckets[bucket_key]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[bucket_key]
+
+    def _closest(self, model: str, text: str) -> Optional[Tuple[str, bytes]]:
+        candidates: Set[Tuple[str, bytes]] = set()
+        for band, value in enumerate(_minhash(text)):
+            candidates |= self._buckets.get((model, band, value), set())
+        best, best_ratio = None, self.fuzzy_threshold
+        for key in candidates:
+            ratio = SequenceMatcher(None, text, self._fuzzy[key][0]).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = key, ratio
+        return best
+
+    def _pack(self, embedding: List[float]) -> bytes:
+        return struct.pack(f"<{len(embedding)}{self._typecode}", *embedding)
+
+    def _unpack(self, packed: bytes) -> List[float]:
+        count = len(packed) // struct.calcsize(self._typecode)
+        return list(struct.unpack(f"<{count}{self._typecode}", packed))
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        if self.normalize:
+            text = _normalize_text(text)
+        key = self._key(model, text)
+        with self._lock:
+            packed = self._data.get(key)
+            if packed is None:
+                if not self._is_fuzzy(text):
+                    return None
+                key = self._closest(model, text)
+                if key is None:
+                    return None
+                packed = self._data[key]
+            self._data.move_to_end(key)
+        return self._unpack(packed)
+
+    def set(self, model: str, text: str, embedding: List[float]) -> None:
+        if self.normalize:
+            text = _normalize_text(text)
+        key = self._key(model, text)
+        packed = self._pack(embedding)
+        if len(packed) > self.max_bytes:
+            # Too large to cache; drop any older entry so it is not served stale.
+            with self._lock:
+                previous = self._data.pop(key, None)
+                if previous is not None:
+                    self._bytes -= len(previous)
+                    self._unindex(key)
+            return
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            elif self._is_fuzzy(text):
+                self._index(key, text)
+            self._data[key] = packed
+            self._bytes += len(packed)
+            while self._bytes > self.max_bytes or (
+                self.maxsize is not None and len(self._data) > self.maxsize
+            ):
+                evicted_key, evicted = self._data.popitem(last=False)
+                self._bytes -= len(evicted)
+                self._unindex(evicted_key)
+
+    def clear(self) -> None:
+        """Remove every cached embedding."""
+        with self._lock:
+            self._data.clear()
+            self._fuzzy.clear()
+            self._buckets.clear()
+            self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total size in bytes of the stored vectors."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _find_uncached(
+    cache: Optional[EmbeddingCache], model: str, texts: Sequence[str]
+) -> Tuple[List[Optional[List[float]]], List[int]]:
+    """
+    Look up every text in the cache.
+
+    Args:
+        cache: The embedding cache. When None, every text is a miss.
+        model: Name of the embedding model.
+        texts: Input texts, in request order.
+
+    Returns:
+        Tuple: The cached vectors (None for misses) and the indices of the misses.
+    """
+    if cache is None:
+        return [None] * len(texts), list(range(len(texts)))
+    vectors = [cache.get(model, text) for text in texts]
+    misses = [i for i, vector in enumerate(vectors) if vector is None]
+    return vectors, misses
+
+
+def _fill_uncached(
+    cache: Optional[EmbeddingCache],
+    model: str,
+    texts: Sequence[str],
+    vectors: List[Optional[List[float]]],
+    misses: Sequence[int],
+    fetched: Sequence[List[float]],
+) -> None:
+    """Place freshly fetched vectors at their original positions and cache them."""
+    if len(fetched) != len(misses):
+        raise SdkException(
+            f"Expected {len(misses)} embeddings from the server, got {len(fetched)}"
+        )
+    for i, embedding in zip(misses, fetched):
+        vectors[i] = embedding
+        if cache is not None:
+            cache.set(model, texts[i], embedding)
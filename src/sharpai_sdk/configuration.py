@@ -1,13 +1,39 @@
+from contextvars import ContextVar
+from typing import Optional, Tuple
+
+import httpx
+
+from .async_base import AsyncBaseClient
 from .base import BaseClient
+from .cache import EmbeddingCache
 
-# Global client instance
+# Global client instances
 _client = None
+_async_client = None
+_embedding_cache = None
+_async_embedding_cache = None
+
+# Per-context (client, embedding cache) pairs set with `context_local=True`.
+# They take precedence over the global instances in the context that set them.
+_context_config: ContextVar[Optional[Tuple[BaseClient, Optional[EmbeddingCache]]]] = (
+    ContextVar("sharpai_context_config", default=None)
+)
+_async_context_config: ContextVar[
+    Optional[Tuple[AsyncBaseClient, Optional[EmbeddingCache]]]
+] = ContextVar("sharpai_async_context_config", default=None)
 
 
 def configure(
     endpoint: str,
     timeout: int = 10,
     retries: int = 3,
+    max_keepalive_connections: int = 20,
+    max_connections: int = 100,
+    keepalive_expiry: float = 30.0,
+    httpx_client: Optional[httpx.Client] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+    context_local: bool = False,
+    http2: bool = False,
 ):
     """
     Configure the SDK with endpoint.
@@ -17,18 +43,119 @@ def configure(
         endpoint (str): The base URL of the SharpAI API (e.g., "http://localhost:8000").
         timeout (int): Request timeout in seconds. Default is 10.
         retries (int): Number of retry attempts for failed requests. Default is 3.
+        max_keepalive_connections (int): Idle connections kept open for reuse. Default is 20.
+        max_connections (int): Maximum concurrent connections in the pool. Default is 100.
+        keepalive_expiry (float): Seconds an idle pooled connection is kept. Default is 30.0.
+        httpx_client (httpx.Client, optional): Pre-configured client to use instead of
+            building one. The pool settings above are ignored when it is provided.
+        embedding_cache (EmbeddingCache, optional): Cache consulted by the embedding
+            methods before calling the server, e.g. `InMemoryEmbeddingCache()`.
+            Embeddings are not cached by default.
+        context_local (bool): When True, the configuration only applies to the current
+            context (thread or asyncio task, and tasks created from it) instead of the
+            whole process. Default is False.
+        http2 (bool): Negotiate HTTP/2 over TLS so concurrent requests share one
+            connection. Requires the `http2` extra. Default is False.
     """
-    global _client
-    _client = BaseClient(
+    global _client, _embedding_cache
+    client = BaseClient(
         base_url=endpoint,
         timeout=timeout,
         retries=retries,
+        max_keepalive_connections=max_keepalive_connections,
+        max_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+        httpx_client=httpx_client,
+        http2=http2,
     )
+    if context_local:
+        _context_config.set((client, embedding_cache))
+    else:
+        _client, _embedding_cache = client, embedding_cache
 
 
 # Utility function to get the shared client
 def get_client():
-    """Get the shared client instance."""
+    """Get the client for the current context, falling back to the shared instance."""
+    config = _context_config.get()
+    if config is not None:
+        return config[0]
     if _client is None:
         raise ValueError("SDK is not configured. Call 'configure' first.")
     return _client
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the embedding cache set up with `configure`, if any."""
+    config = _context_config.get()
+    if config is not None:
+        return config[1]
+    return _embedding_cache
+
+
+def aconfigure(
+    endpoint: str,
+    timeout: int = 10,
+    retries: int = 3,
+    max_keepalive_connections: int = 20,
+    max_connections: int = 100,
+    keepalive_expiry: float = 30.0,
+    httpx_client: Optional[httpx.AsyncClient] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
+    context_local: bool = False,
+    http2: bool = False,
+):
+    """
+    Configure the SDK's asynchronous client used by the `a`-prefixed resource methods.
+    Note: SharpAI SDK does not require access tokens/keys, tenant GUID, or graph GUID.
+
+    Args:
+        endpoint (str): The base URL of the SharpAI API (e.g., "http://localhost:8000").
+        timeout (int): Request timeout in seconds. Default is 10.
+        retries (int): Number of retry attempts for failed requests. Default is 3.
+        max_keepalive_connections (int): Idle connections kept open for reuse. Default is 20.
+        max_connections (int): Maximum concurrent connections in the pool. Default is 100.
+        keepalive_expiry (float): Seconds an idle pooled connection is kept. Default is 30.0.
+        httpx_client (httpx.AsyncClient, optional): Pre-configured client to use instead of
+            building one. The pool settings above are ignored when it is provided.
+        embedding_cache (EmbeddingCache, optional): Cache consulted by the asynchronous
+            embedding methods before calling the server. Not cached by default.
+        context_local (bool): When True, the configuration only applies to the current
+            context (asyncio task, and tasks created from it), so clients bound to
+            different event loops do not clash. Default is False.
+        http2 (bool): Negotiate HTTP/2 over TLS so concurrent requests are multiplexed
+            over one connection. Requires the `http2` extra. Default is False.
+    """
+    global _async_client, _async_embedding_cache
+    client = AsyncBaseClient(
+        base_url=endpoint,
+        timeout=timeout,
+        retries=retries,
+        max_keepalive_connections=max_keepalive_connections,
+        max_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+        httpx_client=httpx_client,
+        http2=http2,
+    )
+    if context_local:
+        _async_context_config.set((client, embedding_cache))
+    else:
+        _async_client, _async_embedding_cache = client, embedding_cache
+
+
+def aget_client():
+    """Get the asynchronous client for the current context, falling back to the shared one."""
+    config = _async_context_config.get()
+    if config is not None:
+        return config[0]
+    if _async_client is None:
+        raise ValueError("SDK async client is not configured. Call 'aconfigure' first.")
+    return _async_client
+
+
+def aget_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the embedding cache set up with `aconfigure`, if any."""
+    config = _async_context_config.get()
+    if config is not None:
+        return config[1]
+    return _async_embedding_cache
@@ -79,6 +79,23 @@ class DeserializationError(SdkException):
     pass
 
 
+# Exception class per API error code, built once at import
+_ERROR_MAPPING = {
+    ApiError_Enum.authentication_failed: AuthenticationError,
+    ApiError_Enum.authorization_failed: AuthorizationError,
+    ApiError_Enum.bad_request: BadRequestError,
+    ApiError_Enum.not_found: ResourceNotFoundError,
+    ApiError_Enum.internal_error: ServerError,
+    ApiError_Enum.too_large: BadRequestError,
+    ApiError_Enum.conflict: ConflictError,
+    ApiError_Enum.inactive: InactiveError,
+    ApiError_Enum.invalid_range: InvalidRangeError,
+    ApiError_Enum.in_use: InUseError,
+    ApiError_Enum.not_empty: NotEmptyError,
+    ApiError_Enum.deserialization_error: DeserializationError,
+}
+
+
 def get_exception_for_error_code(error_code: ApiError_Enum) -> SdkException:
     """
     Maps API error codes to specific exception types.
@@ -87,23 +104,8 @@ def get_exception_for_error_code(error_code: ApiError_Enum) -> SdkException:
     if not isinstance(error_code, ApiError_Enum):
         return SdkException(f"Unknown error: Invalid error code type - {error_code}")
 
-    error_mapping = {
-        ApiError_Enum.authentication_failed: AuthenticationError,
-        ApiError_Enum.authorization_failed: AuthorizationError,
-        ApiError_Enum.bad_request: BadRequestError,
-        ApiError_Enum.not_found: ResourceNotFoundError,
-        ApiError_Enum.internal_error: ServerError,
-        ApiError_Enum.too_large: BadRequestError,
-        ApiError_Enum.conflict: ConflictError,
-        ApiError_Enum.inactive: InactiveError,
-        ApiError_Enum.invalid_range: InvalidRangeError,
-        ApiError_Enum.in_use: InUseError,
-        ApiError_Enum.not_empty: NotEmptyError,
-        ApiError_Enum.deserialization_error: DeserializationError,
-    }
-
     # Get the exception class from the mapping, default to SdkException if not found
-    exception_class = error_mapping.get(error_code, SdkException)
+    exception_class = _ERROR_MAPPING.get(error_code, SdkException)
 
     # Get the error description from the ERROR_DESCRIPTIONS mapping
     error_description = ERROR_DESCRIPTIONS[error_code]
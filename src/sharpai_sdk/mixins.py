@@ -1,20 +1,43 @@
-import json
+from functools import lru_cache
 from typing import List, Optional, Type
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from .configuration import get_client
+from .configuration import aget_client, get_client
 from .models.enumeration_query import EnumerationQueryModel
 from .models.enumeration_result import EnumerationResultModel
-from .utils.url_helper import _get_url_v1, _get_url_v2
+from .utils.json_helper import _json_dumps
+from .utils.url_helper import (
+    _base_url_v1,
+    _base_url_v2,
+    _get_url_v1,
+    _get_url_v2,
+    _resource_url_v1,
+)
 
 JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
 
+# (keyword argument, query flag) pairs for the include options
+_INCLUDE_FLAGS = (("include_data", "incldata"), ("include_subordinates", "inclsub"))
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Return the cached TypeAdapter validating and serializing a list of `model`."""
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def _enumeration_result_model(model: Type[BaseModel]) -> Type[EnumerationResultModel]:
+    """Return the cached `EnumerationResultModel[model]` parameterization."""
+    return EnumerationResultModel[model]
+
 
 class ExistsAPIResource:
     """
     Mixin class for checking if a resource exists.
     If the resource exists, the method returns `True`, otherwise it returns `False`.
+    Network failures are raised rather than reported as a missing resource.
     """
 
     RESOURCE_NAME: str = ""
@@ -22,13 +45,10 @@ class ExistsAPIResource:
     @classmethod
     def exists(cls, guid: str) -> bool:
         client = get_client()
-        url = _get_url_v1(cls, guid)
+        url = _resource_url_v1(cls, guid)
 
-        try:
-            client.request("HEAD", url)
-            return True
-        except Exception:
-            return False
+        response = client.request("HEAD", url, raise_for_status=False)
+        return 200 <= response.status_code < 300
 
 
 class CreateableAPIResource:
@@ -43,11 +63,33 @@ class CreateableAPIResource:
     CREATE_METHOD: str = "PUT"
 
     @classmethod
-    def create(cls, **kwargs) -> "BaseModel":
+    def _create_request(cls, kwargs: dict) -> tuple:
+        """Build the URL, request body arguments and headers for a create call."""
+        headers = kwargs.pop("headers", {})
+
+        # Extract data from kwargs; kwargs is local to the call, so no copy is needed
+        _data = kwargs.pop("_data", kwargs)
+
+        # Build URL
+        url = _base_url_v1(cls)
+        if cls.MODEL is not None:
+            body = {
+                "raw_json": cls.MODEL(**_data)
+                .model_dump_json(by_alias=True, exclude_unset=True)
+                .encode()
+            }
+        else:
+            body = {"json": _data}
+        return url, body, headers
+
+    @classmethod
+    def create(cls, validate_response: bool = True, **kwargs) -> "BaseModel":
         """
         Creates a new resource.
 
         Args:
+            validate_response (bool): Validate the response against the MODEL. When False,
+                the raw response dict is returned. Default is True.
             **kwargs: Keyword arguments for the request, including the resource data.
                 - headers (dict, optional): Additional headers for the request.
                 - _data (dict, optional): The data to be sent in the request body.
@@ -56,23 +98,27 @@ class CreateableAPIResource:
             BaseModel: The created resource, validated against the MODEL if defined.
         """
         client = get_client()
-        headers = kwargs.pop("headers", {})
+        url, body, headers = cls._create_request(kwargs)
 
-        # Extract data from kwargs
-        _data = kwargs.pop("_data", kwargs.copy())
+        # Make request and validate response
+        instance = client.request(cls.CREATE_METHOD, url, headers=headers, **body)
+        if cls.MODEL and validate_response:
+            return cls.MODEL.model_validate(instance)
+        return instance
 
-        # Build URL
-        url = _get_url_v1(cls)
-        if cls.MODEL is not None:
-            data = cls.MODEL(**_data).model_dump(
-                mode="json", by_alias=True, exclude_unset=True
-            )
-        else:
-            data = _data
+    @classmethod
+    async def acreate(cls, validate_response: bool = True, **kwargs) -> "BaseModel":
+        """
+        Asynchronously creates a new resource.
+        Accepts the same arguments as `create`.
+        """
+        client = aget_client()
+        url, body, headers = cls._create_request(kwargs)
 
-        # Make request and validate response
-        instance = client.request(cls.CREATE_METHOD, url, json=data, headers=headers)
-        return cls.MODEL.model_validate(instance) if cls.MODEL else instance
+        instance = await client.request(cls.CREATE_METHOD, url, headers=headers, **body)
+        if cls.MODEL and validate_response:
+            return cls.MODEL.model_validate(instance)
+        return instance
 
 
 class CreateableMultipleAPIResource:
@@ -86,9 +132,12 @@ class CreateableMultipleAPIResource:
     RESOURCE_NAME: str = ""
 
     @classmethod
-    def create_multiple(cls, data: List[dict]) -> List[BaseModel]:
+    def create_multiple(
+        cls, data: List[dict], validate_response: bool = True
+    ) -> List[BaseModel]:
         """
         Creates multiple nodes or edges in a single request.
+        When `validate_response` is False, the raw response list is returned.
         """
         if data is None:
             raise TypeError("Nodes parameter cannot be None")
@@ -98,24 +147,26 @@ class CreateableMultipleAPIResource:
 
         client = get_client()
 
-        # Validate and serialize each node if MODEL is provided
+        # Validate and serialize the nodes in one pass if MODEL is provided
         if cls.MODEL is not None:
-            validated_nodes = [
-                cls.MODEL(**node).model_dump(mode="json", by_alias=True)
-                for node in data
-            ]
+            adapter = _list_adapter(cls.MODEL)
+            body = {
+                "raw_json": adapter.dump_json(
+                    adapter.validate_python(data), by_alias=True
+                )
+            }
         else:
-            validated_nodes = data
+            body = {"json": data}
 
         # Construct URL for multiple creation
-        url = _get_url_v1(cls, "bulk")
+        url = _base_url_v1(cls, "bulk")
 
         # Make the request
-        instances = client.request("PUT", url, json=validated_nodes)
+        instances = client.request("PUT", url, **body)
 
         # Validate response data if MODEL is provided
-        if cls.MODEL is not None:
-            return [cls.MODEL.model_validate(instance) for instance in instances]
+        if cls.MODEL is not None and validate_response:
+            return adapter.validate_python(instances)
         return instances
 
 
@@ -129,23 +180,34 @@ class RetrievableAPIResource:
     RESOURCE_NAME: str = ""
     MODEL: Optional[Type[BaseModel]] = None
 
+    @classmethod
+    def _retrieve_url(cls, guid: str, kwargs: dict) -> str:
+        """Build the URL for a retrieve call."""
+        include = [flag for key, flag in _INCLUDE_FLAGS if kwargs.get(key)]
+        return _resource_url_v1(cls, guid, include)
+
     @classmethod
     def retrieve(cls, guid: str, **kwargs) -> "BaseModel":
         """
         Retrieve a specific instance of the resource by its ID.
         """
         client = get_client()
-        include = {}
-        if kwargs.get("include_data"):
-            include["incldata"] = None
-        if kwargs.get("include_subordinates"):
-            include["inclsub"] = None
-
-        url = _get_url_v1(cls, guid, **include)
+        url = cls._retrieve_url(guid, kwargs)
         instance = client.request("GET", url)
 
         return cls.MODEL.model_validate(instance) if cls.MODEL else instance
 
+    @classmethod
+    async def aretrieve(cls, guid: str, **kwargs) -> "BaseModel":
+        """
+        Asynchronously retrieve a specific instance of the resource by its ID.
+        """
+        client = aget_client()
+        url = cls._retrieve_url(guid, kwargs)
+        instance = await client.request("GET", url)
+
+        return cls.MODEL.model_validate(instance) if cls.MODEL else instance
+
 
 class UpdatableAPIResource:
     """
@@ -162,7 +224,7 @@ class UpdatableAPIResource:
         Update a specific instance of the resource by its ID.
         """
         client = get_client()
-        url = _get_url_v1(cls, guid)
+        url = _resource_url_v1(cls, guid)
 
         if cls.MODEL is not None:
             # For updates, we only send the fields that are provided
@@ -209,17 +271,12 @@ class AllRetrievableAPIResource:
         Retrieve all instances of the resource.
         """
         client = get_client()
-        include = {}
-        if kwargs.get("include_data"):
-            include["incldata"] = None
-        if kwargs.get("include_subordinates"):
-            include["inclsub"] = None
-
-        url = _get_url_v1(cls, **include)
+        include = [flag for key, flag in _INCLUDE_FLAGS if kwargs.get(key)]
+        url = _resource_url_v1(cls, flags=include)
         instances = client.request("GET", url)
 
         return (
-            [cls.MODEL.model_validate(instance) for instance in instances]
+            _list_adapter(cls.MODEL).validate_python(instances)
             if cls.MODEL
             else instances
         )
@@ -248,11 +305,11 @@ class SearchableAPIResource:
         if data.get("include_subordinates"):
             data["IncludeSubordinates"] = True
 
-        url = _get_url_v1(cls, "search")
+        url = _base_url_v1(cls, "search")
         result_model = cls.SEARCH_MODELS[1]
 
         instance = client.request(
-            "POST", url, data=json.dumps(data).encode(), headers=JSON_CONTENT_TYPE
+            "POST", url, raw_json=_json_dumps(data), headers=JSON_CONTENT_TYPE
         )
         return result_model(**instance)
 
@@ -263,6 +320,15 @@ class EnumerableAPIResource:
     RESOURCE_NAME: str = ""
     MODEL: Optional[Type[BaseModel]] = None
 
+    @classmethod
+    def _enumerate_url(cls, kwargs: dict) -> str:
+        """Build the URL for an enumerate call."""
+        kwargs.update(
+            {flag: None for key, flag in _INCLUDE_FLAGS if kwargs.pop(key, False)}
+        )
+
+        return _get_url_v2(cls, **kwargs) if kwargs else _base_url_v2(cls)
+
     @classmethod
     def enumerate(cls, **kwargs) -> "EnumerationResultModel":
         """
@@ -273,17 +339,27 @@ class EnumerableAPIResource:
                 and any pagination metadata.
         """
         client = get_client()
+        url = cls._enumerate_url(kwargs)
 
-        if kwargs.pop("include_data", False):
-            kwargs["incldata"] = None
-        if kwargs.pop("include_subordinates", False):
-            kwargs["inclsub"] = None
+        response = client.request("GET", url)
+        return (
+            _enumeration_result_model(cls.MODEL).model_validate(response)
+            if cls.MODEL
+            else response
+        )
 
-        url = _get_url_v2(cls, **kwargs)
+    @classmethod
+    async def aenumerate(cls, **kwargs) -> "EnumerationResultModel":
+        """
+        Asynchronously enumerates resources of a given type.
+        Accepts the same arguments as `enumerate`.
+        """
+        client = aget_client()
+        url = cls._enumerate_url(kwargs)
 
-        response = client.request("GET", url)
+        response = await client.request("GET", url)
         return (
-            EnumerationResultModel[cls.MODEL].model_validate(response)
+            _enumeration_result_model(cls.MODEL).model_validate(response)
             if cls.MODEL
             else response
         )
@@ -317,24 +393,27 @@ class EnumerableAPIResourceWithData:
         """
         client = get_client()
 
-        data_dict = kwargs.pop(
-            "_data", kwargs.copy()
-        )  # Get 'data' if provided, else use kwargs
+        data_dict = kwargs.pop("_data", None)
+
+        # Build the URL before kwargs is reused (and mutated) as the request body
+        url = _get_url_v2(cls, **kwargs)
 
+        if data_dict is None:
+            data_dict = kwargs
         if data_dict.pop("include_data", False):
             data_dict["IncludeData"] = True
         if data_dict.pop("include_subordinates", False):
             data_dict["IncludeSubordinates"] = True
 
-        url = _get_url_v2(cls, **kwargs)
-
-        data = cls.ENUMERABLE_REQUEST_MODEL(**data_dict).model_dump(
-            mode="json", by_alias=True, exclude_unset=True
+        raw_json = (
+            cls.ENUMERABLE_REQUEST_MODEL(**data_dict)
+            .model_dump_json(by_alias=True, exclude_unset=True)
+            .encode()
         )
 
-        response = client.request("POST", url, json=data)
+        response = client.request("POST", url, raw_json=raw_json)
         return (
-            EnumerationResultModel[cls.MODEL].model_validate(response)
+            _enumeration_result_model(cls.MODEL).model_validate(response)
             if cls.MODEL
             else response
         )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..enums.operator_enum import Opertator_Enum
 
@@ -6,8 +6,11 @@ from ..enums.operator_enum import Opertator_Enum
 class ExprModel(BaseModel):
     """
     Represents an expression with a left operand, an operator, and a right operand.
+    Instances are immutable and hashable, so they can be shared between queries.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     Left: str = Field(default="")
     Operator: Opertator_Enum = Field(default=Opertator_Enum.Equals)
     Right: str = Field(default="")
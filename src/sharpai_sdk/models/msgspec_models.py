@@ -0,0 +1,28 @@
+from typing import Any, List, Optional
+
+try:
+    import msgspec
+except ImportError as e:
+    raise ImportError(
+        "The msgspec response models require msgspec. "
+        "Install it with `pip install sharpai-sdk-python[msgspec]`."
+    ) from e
+
+
+class ModelInfoStruct(msgspec.Struct):
+    """msgspec mirror of `ModelInfo`."""
+
+    name: str
+    modified_at: Optional[str] = None
+    size: Optional[int] = None
+    digest: Optional[str] = None
+    details: Optional[Any] = None
+
+
+class TagsResponseStruct(msgspec.Struct):
+    """msgspec mirror of `TagsResponse`, decoded with `list_models_fast`."""
+
+    models: List[ModelInfoStruct] = []
+
+
+tags_response_decoder = msgspec.json.Decoder(TagsResponseStruct)
@@ -1,24 +1,25 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, TypedDict, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel
 
 
 class ModelInfo(BaseModel):
-    """Model information from tags endpoint."""
-
-    model_config = ConfigDict(populate_by_name=True)
+    """
+    Model information from tags endpoint.
+    `details` is kept as the raw dict returned by the server, without validation.
+    """
 
     name: str
-    modified_at: Optional[str] = Field(None, alias="modified_at")
+    modified_at: Optional[str] = None
     size: Optional[int] = None
     digest: Optional[str] = None
-    details: Optional[Dict[str, Any]] = None
+    details: Optional[Any] = None
 
 
 class TagsResponse(BaseModel):
     """Response from /api/tags endpoint."""
 
-    models: List[ModelInfo] = Field(default_factory=list)
+    models: List[ModelInfo] = []
 
 
 class PullRequest(BaseModel):
@@ -54,38 +55,42 @@ class EmbedResponse(BaseModel):
     embeddings: Optional[List[EmbeddingData]] = None
 
 
-class GenerateOptions(BaseModel):
-    """Options for generate request."""
-
-    num_keep: Optional[int] = None
-    seed: Optional[int] = None
-    num_predict: Optional[int] = None
-    top_k: Optional[int] = None
-    top_p: Optional[float] = None
-    min_p: Optional[float] = None
-    tfs_z: Optional[float] = None
-    typical_p: Optional[float] = None
-    repeat_last_n: Optional[int] = None
-    temperature: Optional[float] = None
-    repeat_penalty: Optional[float] = None
-    presence_penalty: Optional[float] = None
-    frequency_penalty: Optional[float] = None
-    mirostat: Optional[int] = None
-    mirostat_tau: Optional[float] = None
-    mirostat_eta: Optional[float] = None
-    penalize_newline: Optional[bool] = None
-    stop: Optional[List[str]] = None
-    numa: Optional[bool] = None
-    num_ctx: Optional[int] = None
-    num_batch: Optional[int] = None
-    num_gpu: Optional[int] = None
-    main_gpu: Optional[int] = None
-    low_vram: Optional[bool] = None
-    f16_kv: Optional[bool] = None
-    vocab_only: Optional[bool] = None
-    use_mmap: Optional[bool] = None
-    use_mlock: Optional[bool] = None
-    num_thread: Optional[int] = None
+class GenerateOptions(TypedDict, total=False):
+    """
+    Options for generate and chat requests.
+    A plain dict at runtime: options are forwarded to the server as given, without
+    per-field validation. Keys the server supports but are not listed here are allowed.
+    """
+
+    num_keep: int
+    seed: int
+    num_predict: int
+    top_k: int
+    top_p: float
+    min_p: float
+    tfs_z: float
+    typical_p: float
+    repeat_last_n: int
+    temperature: float
+    repeat_penalty: float
+    presence_penalty: float
+    frequency_penalty: float
+    mirostat: int
+    mirostat_tau: float
+    mirostat_eta: float
+    penalize_newline: bool
+    stop: List[str]
+    numa: bool
+    num_ctx: int
+    num_batch: int
+    num_gpu: int
+    main_gpu: int
+    low_vram: bool
+    f16_kv: bool
+    vocab_only: bool
+    use_mmap: bool
+    use_mlock: bool
+    num_thread: int
 
 
 class GenerateRequest(BaseModel):
@@ -94,7 +99,7 @@ class GenerateRequest(BaseModel):
     model: str
     prompt: str
     stream: Optional[bool] = False
-    options: Optional[GenerateOptions] = None
+    options: Optional[Dict[str, Any]] = None
 
 
 class GenerateResponse(BaseModel):
@@ -127,7 +132,7 @@ class ChatRequest(BaseModel):
     model: str
     messages: List[ChatMessage]
     stream: Optional[bool] = False
-    options: Optional[GenerateOptions] = None
+    options: Optional[Dict[str, Any]] = None
 
 
 class ChatResponse(BaseModel):
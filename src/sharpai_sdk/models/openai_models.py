@@ -114,3 +114,28 @@ class OpenAIChatCompletionResponse(BaseModel):
     model: str
     choices: List[ChatCompletionChoice]
     usage: Optional[dict] = None
+
+
+class ChatCompletionDelta(BaseModel):
+    """Incremental message content in a streamed chat completion chunk."""
+
+    role: Optional[str] = None
+    content: Optional[str] = None
+
+
+class ChatCompletionChunkChoice(BaseModel):
+    """Single choice in a streamed chat completion chunk."""
+
+    index: int
+    delta: ChatCompletionDelta
+    finish_reason: Optional[str] = None
+
+
+class OpenAIChatCompletionChunk(BaseModel):
+    """Chunk streamed from /v1/chat/completions when `stream=True`."""
+
+    id: str
+    object: str = "chat.completion.chunk"
+    created: int
+    model: str
+    choices: List[ChatCompletionChunkChoice]
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from functools import partial
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -9,6 +10,6 @@ class TimestampModel(BaseModel):
     """
 
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), alias="Timestamp"
+        default_factory=partial(datetime.now, timezone.utc), alias="Timestamp"
     )
     model_config = ConfigDict(populate_by_name=True)
@@ -1,4 +1,7 @@
-from ..configuration import get_client
+import httpx
+
+from ..configuration import aget_client, get_client
+from ..exceptions import SdkException
 
 
 class Connectivity:
@@ -11,13 +14,30 @@ class Connectivity:
     def validate(cls) -> bool:
         """
         Validate connectivity to the API.
+        Any response other than a server error (5xx) means the API is reachable.
 
         Returns:
             bool: True if the API is reachable, False otherwise.
         """
         client = get_client()
         try:
-            client.request("HEAD", "")
-            return True
-        except Exception:
+            response = client.request("HEAD", "", raise_for_status=False)
+        except (httpx.HTTPError, SdkException):
+            return False
+        return response.status_code < 500
+
+    @classmethod
+    async def avalidate(cls) -> bool:
+        """
+        Asynchronously validate connectivity to the API.
+        Any response other than a server error (5xx) means the API is reachable.
+
+        Returns:
+            bool: True if the API is reachable, False otherwise.
+        """
+        client = aget_client()
+        try:
+            response = await client.request("HEAD", "", raise_for_status=False)
+        except (httpx.HTTPError, SdkException):
             return False
+        return response.status_code < 500
@@ -1,26 +1,141 @@
-from typing import List, Optional, Union
+from functools import lru_cache, partial
+from typing import AsyncIterator, Iterator, List, Optional, Union
 
-from ..configuration import get_client
+from ..cache import _fill_uncached, _find_uncached
+from ..configuration import (
+    aget_client,
+    aget_embedding_cache,
+    get_client,
+    get_embedding_cache,
+)
 from ..models.ollama_models import (
-    ChatMessage,
-    ChatRequest,
     ChatResponse,
-    DeleteRequest,
-    EmbedRequest,
+    EmbeddingData,
     EmbedResponse,
-    GenerateRequest,
+    GenerateOptions,
     GenerateResponse,
-    PullRequest,
     TagsResponse,
 )
+from ..utils.array_helper import _float32_array
+from ..utils.batch_helper import _arun_batches, _check_batching, _run_batches
+from ..utils.json_helper import _json_dumps
+from ..utils.request_helper import _request_body
+from ..utils.stream_helper import _astream_models, _stream_models
+
+DEFAULT_EMBED_BATCH_SIZE = 64
+
+
+@lru_cache(maxsize=128)
+def _pull_body(model: str) -> bytes:
+    """Serialized pull request body, cached per model name."""
+    return _json_dumps({"model": model})
+
+
+@lru_cache(maxsize=128)
+def _delete_body(name: str) -> bytes:
+    """Serialized delete request body, cached per model name."""
+    return _json_dumps({"name": name})
 
 
 class Ollama:
     """
     Ollama API resource class.
     Provides methods for interacting with Ollama-compatible endpoints.
+    Every method has an `a`-prefixed asynchronous twin that uses the client set up
+    with `aconfigure`.
     """
 
+    @classmethod
+    def _embed_request(cls, model: str, input_data: Union[str, List[str]]) -> dict:
+        return {"model": model, "input": input_data}
+
+    @classmethod
+    def _fetch_embeddings(
+        cls, client, model: str, input_data: Union[str, List[str]]
+    ) -> List[List[float]]:
+        request_data = cls._embed_request(model, input_data)
+        response = client.request("POST", "api/embed", json=request_data)
+        return cls._embed_vectors(cls._parse_embed_response(response))
+
+    @classmethod
+    async def _afetch_embeddings(
+        cls, client, model: str, input_data: Union[str, List[str]]
+    ) -> List[List[float]]:
+        request_data = cls._embed_request(model, input_data)
+        response = await client.request("POST", "api/embed", json=request_data)
+        return cls._embed_vectors(cls._parse_embed_response(response))
+
+    @classmethod
+    def _parse_embed_response(cls, response: dict) -> EmbedResponse:
+        """
+        Build an EmbedResponse from server JSON without validating it.
+        Validating every float dominates the cost of parsing embeddings; this is only
+        safe because the data comes from the SharpAI API.
+        """
+        embeddings = response.get("embeddings")
+        if embeddings is not None:
+            response = {
+                **response,
+                "embeddings": [EmbeddingData.model_construct(**e) for e in embeddings],
+            }
+        return EmbedResponse.model_construct(**response)
+
+    @classmethod
+    def _embed_vectors(cls, response: EmbedResponse) -> List[List[float]]:
+        if response.embeddings is not None:
+            return [item.embedding for item in response.embeddings]
+        return [] if response.embedding is None else [response.embedding]
+
+    @classmethod
+    def _embed_response(
+        cls, input_data: Union[str, List[str]], vectors: List[List[float]]
+    ) -> EmbedResponse:
+        """
+        Build the EmbedResponse returned for `input_data`.
+        The server may answer a single string with either `embedding` or `embeddings`,
+        so every path fills `embeddings`, and also `embedding` for a single string.
+        This keeps the result the same whether vectors came from the server, from
+        several batches or from the cache.
+        """
+        embeddings = [
+            EmbeddingData.model_construct(embedding=vector, index=i)
+            for i, vector in enumerate(vectors)
+        ]
+        if isinstance(input_data, str):
+            return EmbedResponse.model_construct(
+                embedding=vectors[0], embeddings=embeddings
+            )
+        return EmbedResponse.model_construct(embeddings=embeddings)
+
+    @classmethod
+    def _generate_request(
+        cls,
+        model: str,
+        prompt: str,
+        stream: Optional[bool],
+        options: Optional[GenerateOptions],
+    ) -> dict:
+        return _request_body(model=model, prompt=prompt, stream=stream, options=options)
+
+    @classmethod
+    def _chat_request(
+        cls,
+        model: str,
+        messages: List[dict],
+        stream: Optional[bool],
+        options: Optional[GenerateOptions],
+    ) -> dict:
+        # Dict messages are sent as is; ChatMessage objects are dumped to dicts
+        chat_messages = [
+            msg
+            if isinstance(msg, dict)
+            else msg.model_dump(mode="json", exclude_unset=True)
+            for msg in messages
+        ]
+        return _request_body(
+            model=model, messages=chat_messages, stream=stream, options=options
+        )
+
     @classmethod
     def list_models(cls) -> TagsResponse:
         """
@@ -33,6 +148,50 @@ class Ollama:
         response = client.request("GET", "api/tags")
         return TagsResponse(**response)
 
+    @classmethod
+    async def alist_models(cls) -> TagsResponse:
+        """
+        Asynchronously list all local models.
+
+        Returns:
+            TagsResponse: List of available models.
+        """
+        client = aget_client()
+        response = await client.request("GET", "api/tags")
+        return TagsResponse(**response)
+
+    @classmethod
+    def list_models_fast(cls):
+        """
+        List all local models, decoding the response with msgspec instead of pydantic.
+        Faster for large model lists; requires the `msgspec` extra.
+
+        Returns:
+            TagsResponseStruct: List of available models, with the same fields as
+                TagsResponse.
+        """
+        from ..models.msgspec_models import tags_response_decoder
+
+        client = get_client()
+        content = client.request("GET", "api/tags", decode=False)
+        return tags_response_decoder.decode(content)
+
+    @classmethod
+    async def alist_models_fast(cls):
+        """
+        Asynchronously list all local models, decoding the response with msgspec.
+        Requires the `msgspec` extra.
+
+        Returns:
+            TagsResponseStruct: List of available models, with the same fields as
+                TagsResponse.
+        """
+        from ..models.msgspec_models import tags_response_decoder
+
+        client = aget_client()
+        content = await client.request("GET", "api/tags", decode=False)
+        return tags_response_decoder.decode(content)
+
     @classmethod
     def pull_model(cls, model: str) -> dict:
         """
@@ -45,10 +204,22 @@ class Ollama:
             dict: Response from the API.
         """
         client = get_client()
-        request_data = PullRequest(model=model).model_dump(
-            mode="json", exclude_unset=True
-        )
-        response = client.request("POST", "api/pull", json=request_data)
+        response = client.request("POST", "api/pull", raw_json=_pull_body(model))
+        return response
+
+    @classmethod
+    async def apull_model(cls, model: str) -> dict:
+        """
+        Asynchronously pull a model from the registry.
+
+        Args:
+            model: Name of the model to pull.
+
+        Returns:
+            dict: Response from the API.
+        """
+        client = aget_client()
+        response = await client.request("POST", "api/pull", raw_json=_pull_body(model))
         return response
 
     @classmethod
@@ -63,32 +234,139 @@ class Ollama:
             dict: Response from the API.
         """
         client = get_client()
-        request_data = DeleteRequest(name=name).model_dump(
-            mode="json", exclude_unset=True
+        response = client.request("DELETE", "api/delete", raw_json=_delete_body(name))
+        return response
+
+    @classmethod
+    async def adelete_model(cls, name: str) -> dict:
+        """
+        Asynchronously delete a model.
+
+        Args:
+            name: Name of the model to delete.
+
+        Returns:
+            dict: Response from the API.
+        """
+        client = aget_client()
+        response = await client.request(
+            "DELETE", "api/delete", raw_json=_delete_body(name)
         )
-        response = client.request("DELETE", "api/delete", json=request_data)
         return response
 
     @classmethod
     def generate_embedding(
-        cls, model: str, input_data: Union[str, List[str]]
+        cls,
+        model: str,
+        input_data: Union[str, List[str]],
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+        return_numpy: bool = False,
     ) -> EmbedResponse:
         """
         Generate embeddings for text input.
+        A list is sent as one request, or split into concurrent requests of at most
+        `batch_size` inputs. When an embedding cache is configured, only inputs missing
+        from it are sent.
 
         Args:
             model: Name of the embedding model to use.
             input_data: Single string or list of strings to generate embeddings for.
+            batch_size: Maximum number of inputs per request. Default is 64.
+            max_concurrent_batches: Maximum number of requests in flight. Default is 4.
+            return_numpy: Return the vectors as a float32 numpy array (1-D for a single
+                string, one row per input for a list) instead of an EmbedResponse.
+                Requires numpy. Default is False.
 
         Returns:
-            EmbedResponse: Embedding response with embeddings.
+            EmbedResponse: Embedding response with `embeddings` filled (and `embedding`
+                for a single string), or a numpy.ndarray when `return_numpy` is True.
         """
+        _check_batching(batch_size, max_concurrent_batches)
         client = get_client()
-        request_data = EmbedRequest(model=model, input=input_data).model_dump(
-            mode="json", exclude_unset=True
-        )
-        response = client.request("POST", "api/embed", json=request_data)
-        return EmbedResponse(**response)
+        cache = get_embedding_cache()
+        single = isinstance(input_data, str)
+        if cache is None and (single or len(input_data) <= batch_size):
+            request_data = cls._embed_request(model, input_data)
+            response = client.request("POST", "api/embed", json=request_data)
+            vectors = cls._embed_vectors(cls._parse_embed_response(response))
+            if not return_numpy:
+                return cls._embed_response(input_data, vectors)
+            return _float32_array(vectors[0] if single else vectors)
+
+        texts = [input_data] if single else list(input_data)
+        vectors, misses = _find_uncached(cache, model, texts)
+        if misses:
+            if single:
+                fetched = cls._fetch_embeddings(client, model, input_data)
+            else:
+                fetched = _run_batches(
+                    partial(cls._fetch_embeddings, client, model),
+                    [texts[i] for i in misses],
+                    batch_size,
+                    max_concurrent_batches,
+                )
+            _fill_uncached(cache, model, texts, vectors, misses, fetched)
+        if return_numpy:
+            return _float32_array(vectors[0] if single else vectors)
+        return cls._embed_response(input_data, vectors)
+
+    @classmethod
+    async def agenerate_embedding(
+        cls,
+        model: str,
+        input_data: Union[str, List[str]],
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+        return_numpy: bool = False,
+    ) -> EmbedResponse:
+        """
+        Asynchronously generate embeddings for text input.
+        A list is sent as one request, or split into concurrent requests of at most
+        `batch_size` inputs. When an embedding cache is configured, only inputs missing
+        from it are sent.
+
+        Args:
+            model: Name of the embedding model to use.
+            input_data: Single string or list of strings to generate embeddings for.
+            batch_size: Maximum number of inputs per request. Default is 64.
+            max_concurrent_batches: Maximum number of requests in flight. Default is 4.
+            return_numpy: Return the vectors as a float32 numpy array (1-D for a single
+                string, one row per input for a list) instead of an EmbedResponse.
+                Requires numpy. Default is False.
+
+        Returns:
+            EmbedResponse: Embedding response with `embeddings` filled (and `embedding`
+                for a single string), or a numpy.ndarray when `return_numpy` is True.
+        """
+        _check_batching(batch_size, max_concurrent_batches)
+        client = aget_client()
+        cache = aget_embedding_cache()
+        single = isinstance(input_data, str)
+        if cache is None and (single or len(input_data) <= batch_size):
+            request_data = cls._embed_request(model, input_data)
+            response = await client.request("POST", "api/embed", json=request_data)
+            vectors = cls._embed_vectors(cls._parse_embed_response(response))
+            if not return_numpy:
+                return cls._embed_response(input_data, vectors)
+            return _float32_array(vectors[0] if single else vectors)
+
+        texts = [input_data] if single else list(input_data)
+        vectors, misses = _find_uncached(cache, model, texts)
+        if misses:
+            if single:
+                fetched = await cls._afetch_embeddings(client, model, input_data)
+            else:
+                fetched = await _arun_batches(
+                    partial(cls._afetch_embeddings, client, model),
+                    [texts[i] for i in misses],
+                    batch_size,
+                    max_concurrent_batches,
+                )
+            _fill_uncached(cache, model, texts, vectors, misses, fetched)
+        if return_numpy:
+            return _float32_array(vectors[0] if single else vectors)
+        return cls._embed_response(input_data, vectors)
 
     @classmethod
     def generate(
@@ -96,54 +374,112 @@ class Ollama:
         model: str,
         prompt: str,
         stream: Optional[bool] = False,
-        options: Optional[dict] = None,
-    ) -> GenerateResponse:
+        options: Optional[GenerateOptions] = None,
+    ) -> Union[GenerateResponse, Iterator[GenerateResponse]]:
         """
         Generate a completion for a prompt.
 
         Args:
             model: Name of the model to use.
             prompt: The prompt text.
-            stream: Whether to stream the response.
+            stream: Whether to stream the response. When True, an iterator of partial
+                GenerateResponse chunks is returned.
             options: Optional generation parameters.
 
         Returns:
             GenerateResponse: Generated completion response.
         """
         client = get_client()
-        request_data = GenerateRequest(
-            model=model, prompt=prompt, stream=stream, options=options
-        ).model_dump(mode="json", exclude_unset=True)
+        request_data = cls._generate_request(model, prompt, stream, options)
+        if stream:
+            return _stream_models(
+                client, "api/generate", request_data, GenerateResponse
+            )
         response = client.request("POST", "api/generate", json=request_data)
         return GenerateResponse(**response)
 
+    @classmethod
+    async def agenerate(
+        cls,
+        model: str,
+        prompt: str,
+        stream: Optional[bool] = False,
+        options: Optional[GenerateOptions] = None,
+    ) -> Union[GenerateResponse, AsyncIterator[GenerateResponse]]:
+        """
+        Asynchronously generate a completion for a prompt.
+
+        Args:
+            model: Name of the model to use.
+            prompt: The prompt text.
+            stream: Whether to stream the response. When True, an async iterator of
+                partial GenerateResponse chunks is returned.
+            options: Optional generation parameters.
+
+        Returns:
+            GenerateResponse: Generated completion response.
+        """
+        client = aget_client()
+        request_data = cls._generate_request(model, prompt, stream, options)
+        if stream:
+            return _astream_models(
+                client, "api/generate", request_data, GenerateResponse
+            )
+        response = await client.request("POST", "api/generate", json=request_data)
+        return GenerateResponse(**response)
+
     @classmethod
     def chat(
         cls,
         model: str,
         messages: List[dict],
         stream: Optional[bool] = False,
-        options: Optional[dict] = None,
-    ) -> ChatResponse:
+        options: Optional[GenerateOptions] = None,
+    ) -> Union[ChatResponse, Iterator[ChatResponse]]:
         """
         Generate a chat completion.
 
         Args:
             model: Name of the model to use.
             messages: List of message dictionaries with 'role' and 'content' keys.
-            stream: Whether to stream the response.
+            stream: Whether to stream the response. When True, an iterator of partial
+                ChatResponse chunks is returned.
             options: Optional generation parameters.
 
         Returns:
             ChatResponse: Chat completion response.
         """
         client = get_client()
-        # Convert dict messages to ChatMessage objects
-        chat_messages = [
-            ChatMessage(**msg) if isinstance(msg, dict) else msg for msg in messages
-        ]
-        request_data = ChatRequest(
-            model=model, messages=chat_messages, stream=stream, options=options
-        ).model_dump(mode="json", exclude_unset=True)
+        request_data = cls._chat_request(model, messages, stream, options)
+        if stream:
+            return _stream_models(client, "api/chat", request_data, ChatResponse)
         response = client.request("POST", "api/chat", json=request_data)
         return ChatResponse(**response)
+
+    @classmethod
+    async def achat(
+        cls,
+        model: str,
+        messages: List[dict],
+        stream: Optional[bool] = False,
+        options: Optional[GenerateOptions] = None,
+    ) -> Union[ChatResponse, AsyncIterator[ChatResponse]]:
+        """
+        Asynchronously generate a chat completion.
+
+        Args:
+            model: Name of the model to use.
+            messages: List of message dictionaries with 'role' and 'content' keys.
+            stream: Whether to stream the response. When True, an async iterator of
+                partial ChatResponse chunks is returned.
+            options: Optional generation parameters.
+
+        Returns:
+            ChatResponse: Chat completion response.
+        """
+        client = aget_client()
+        request_data = cls._chat_request(model, messages, stream, options)
+        if stream:
+            return _astream_models(client, "api/chat", request_data, ChatResponse)
+        response = await client.request("POST", "api/chat", json=request_data)
+        return ChatResponse(**response)
@@ -1,43 +1,272 @@
-from typing import List, Optional, Union
+from functools import partial
+from typing import AsyncIterator, Iterator, List, Optional, Union
 
-from ..configuration import get_client
+from ..cache import _fill_uncached, _find_uncached
+from ..configuration import (
+    aget_client,
+    aget_embedding_cache,
+    get_client,
+    get_embedding_cache,
+)
 from ..models.openai_models import (
-    OpenAIChatCompletionRequest,
+    EmbeddingObject,
+    OpenAIChatCompletionChunk,
     OpenAIChatCompletionResponse,
-    OpenAICompletionRequest,
     OpenAICompletionResponse,
-    OpenAIEmbeddingRequest,
     OpenAIEmbeddingResponse,
 )
+from ..utils.array_helper import _float32_array
+from ..utils.batch_helper import _arun_batches, _check_batching, _run_batches
+from ..utils.request_helper import _request_body
+from ..utils.stream_helper import (
+    _aiter_sse,
+    _astream_models,
+    _iter_sse,
+    _stream_models,
+)
+
+DEFAULT_EMBEDDING_BATCH_SIZE = 128
+
+
+def _by_index(item: EmbeddingObject) -> int:
+    return item.index
+
+
+def _sum_usage(total: dict, usage: dict) -> dict:
+    """Add the counts in `usage` to `total`, merging nested dicts recursively."""
+    for key, value in usage.items():
+        current = total.get(key)
+        if isinstance(value, dict):
+            total[key] = _sum_usage(
+                dict(current) if isinstance(current, dict) else {}, value
+            )
+        elif (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and isinstance(current, int)
+        ):
+            total[key] = current + value
+        elif current is None:
+            total[key] = value
+    return total
 
 
 class OpenAI:
     """
     OpenAI-compatible API resource class.
     Provides methods for interacting with OpenAI-compatible endpoints.
+    Every method has an `a`-prefixed asynchronous twin that uses the client set up
+    with `aconfigure`.
     """
 
+    @classmethod
+    def _embedding_request(cls, **params) -> dict:
+        return _request_body(**params)
+
+    @classmethod
+    def _fetch_embeddings(
+        cls,
+        client,
+        model: str,
+        user: Optional[str],
+        responses: List[OpenAIEmbeddingResponse],
+        input_data: Union[str, List[str]],
+    ) -> List[List[float]]:
+        request_data = cls._embedding_request(model=model, input=input_data, user=user)
+        response = cls._parse_embedding_response(
+            client.request("POST", "v1/embeddings", json=request_data)
+        )
+        responses.append(response)
+        return [item.embedding for item in sorted(response.data, key=_by_index)]
+
+    @classmethod
+    async def _afetch_embeddings(
+        cls,
+        client,
+        model: str,
+        user: Optional[str],
+        responses: List[OpenAIEmbeddingResponse],
+        input_data: Union[str, List[str]],
+    ) -> List[List[float]]:
+        request_data = cls._embedding_request(model=model, input=input_data, user=user)
+        response = cls._parse_embedding_response(
+            await client.request("POST", "v1/embeddings", json=request_data)
+        )
+        responses.append(response)
+        return [item.embedding for item in sorted(response.data, key=_by_index)]
+
+    @classmethod
+    def _parse_embedding_response(cls, response: dict) -> OpenAIEmbeddingResponse:
+        """
+        Build an OpenAIEmbeddingResponse from server JSON without validating it.
+        Validating every float dominates the cost of parsing embeddings; this is only
+        safe because the data comes from the SharpAI API.
+        """
+        data = [EmbeddingObject.model_construct(**item) for item in response["data"]]
+        return OpenAIEmbeddingResponse.model_construct(**{**response, "data": data})
+
+    @classmethod
+    def _embedding_response(
+        cls,
+        model: str,
+        vectors: List[List[float]],
+        responses: List[OpenAIEmbeddingResponse],
+    ) -> OpenAIEmbeddingResponse:
+        usage = None
+        for response in responses:
+            if response.usage:
+                usage = _sum_usage(usage or {}, response.usage)
+        return OpenAIEmbeddingResponse.model_construct(
+            data=[
+                EmbeddingObject.model_construct(embedding=vector, index=i)
+                for i, vector in enumerate(vectors)
+            ],
+            model=responses[0].model if responses else model,
+            usage=usage,
+        )
+
+    @classmethod
+    def _completion_request(cls, **params) -> dict:
+        return _request_body(**params)
+
+    @classmethod
+    def _chat_completion_request(cls, messages: List[dict], **params) -> dict:
+        # Dict messages are sent as is; ChatCompletionMessage objects are dumped
+        params["messages"] = [
+            msg
+            if isinstance(msg, dict)
+            else msg.model_dump(mode="json", exclude_unset=True)
+            for msg in messages
+        ]
+        return _request_body(**params)
+
     @classmethod
     def create_embedding(
-        cls, model: str, input_data: Union[str, List[str]], user: Optional[str] = None
+        cls,
+        model: str,
+        input_data: Union[str, List[str]],
+        user: Optional[str] = None,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+        return_numpy: bool = False,
     ) -> OpenAIEmbeddingResponse:
         """
         Create embeddings for input text.
+        A list is sent as one request, or split into concurrent requests of at most
+        `batch_size` inputs. When an embedding cache is configured, only inputs missing
+        from it are sent.
 
         Args:
             model: Name of the embedding model to use.
             input_data: Single string or list of strings to generate embeddings for.
             user: Optional user identifier.
+            batch_size: Maximum number of inputs per request. Default is 128.
+            max_concurrent_batches: Maximum number of requests in flight. Default is 4.
+            return_numpy: Return the vectors as a float32 numpy array (1-D for a single
+                string, one row per input for a list) instead of an
+                OpenAIEmbeddingResponse. Requires numpy. Default is False.
 
         Returns:
-            OpenAIEmbeddingResponse: Embedding response in OpenAI format.
+            OpenAIEmbeddingResponse: Embedding response in OpenAI format, or a
+                numpy.ndarray when `return_numpy` is True.
         """
+        _check_batching(batch_size, max_concurrent_batches)
         client = get_client()
-        request_data = OpenAIEmbeddingRequest(
-            model=model, input=input_data, user=user
-        ).model_dump(mode="json", exclude_unset=True)
-        response = client.request("POST", "v1/embeddings", json=request_data)
-        return OpenAIEmbeddingResponse(**response)
+        cache = get_embedding_cache()
+        single = isinstance(input_data, str)
+        if cache is None and (single or len(input_data) <= batch_size):
+            request_data = cls._embedding_request(
+                model=model, input=input_data, user=user
+            )
+            response = client.request("POST", "v1/embeddings", json=request_data)
+            response = cls._parse_embedding_response(response)
+            vectors = [item.embedding for item in sorted(response.data, key=_by_index)]
+            if not return_numpy:
+                return cls._embedding_response(model, vectors, [response])
+            return _float32_array(vectors[0] if single else vectors)
+
+        texts = [input_data] if single else list(input_data)
+        vectors, misses = _find_uncached(cache, model, texts)
+        responses: List[OpenAIEmbeddingResponse] = []
+        if misses:
+            fetch = partial(cls._fetch_embeddings, client, model, user, responses)
+            if single:
+                fetched = fetch(input_data)
+            else:
+                fetched = _run_batches(
+                    fetch,
+                    [texts[i] for i in misses],
+                    batch_size,
+                    max_concurrent_batches,
+                )
+            _fill_uncached(cache, model, texts, vectors, misses, fetched)
+        if return_numpy:
+            return _float32_array(vectors[0] if single else vectors)
+        return cls._embedding_response(model, vectors, responses)
+
+    @classmethod
+    async def acreate_embedding(
+        cls,
+        model: str,
+        input_data: Union[str, List[str]],
+        user: Optional[str] = None,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_concurrent_batches: int = 4,
+        return_numpy: bool = False,
+    ) -> OpenAIEmbeddingResponse:
+        """
+        Asynchronously create embeddings for input text.
+        A list is sent as one request, or split into concurrent requests of at most
+        `batch_size` inputs. When an embedding cache is configured, only inputs missing
+        from it are sent.
+
+        Args:
+            model: Name of the embedding model to use.
+            input_data: Single string or list of strings to generate embeddings for.
+            user: Optional user identifier.
+            batch_size: Maximum number of inputs per request. Default is 128.
+            max_concurrent_batches: Maximum number of requests in flight. Default is 4.
+            return_numpy: Return the vectors as a float32 numpy array (1-D for a single
+                string, one row per input for a list) instead of an
+                OpenAIEmbeddingResponse. Requires numpy. Default is False.
+
+        Returns:
+            OpenAIEmbeddingResponse: Embedding response in OpenAI format, or a
+                numpy.ndarray when `return_numpy` is True.
+        """
+        _check_batching(batch_size, max_concurrent_batches)
+        client = aget_client()
+        cache = aget_embedding_cache()
+        single = isinstance(input_data, str)
+        if cache is None and (single or len(input_data) <= batch_size):
+            request_data = cls._embedding_request(
+                model=model, input=input_data, user=user
+            )
+            response = await client.request("POST", "v1/embeddings", json=request_data)
+            response = cls._parse_embedding_response(response)
+            vectors = [item.embedding for item in sorted(response.data, key=_by_index)]
+            if not return_numpy:
+                return cls._embedding_response(model, vectors, [response])
+            return _float32_array(vectors[0] if single else vectors)
+
+        texts = [input_data] if single else list(input_data)
+        vectors, misses = _find_uncached(cache, model, texts)
+        responses: List[OpenAIEmbeddingResponse] = []
+        if misses:
+            fetch = partial(cls._afetch_embeddings, client, model, user, responses)
+            if single:
+                fetched = await fetch(input_data)
+            else:
+                fetched = await _arun_batches(
+                    fetch,
+                    [texts[i] for i in misses],
+                    batch_size,
+                    max_concurrent_batches,
+                )
+            _fill_uncached(cache, model, texts, vectors, misses, fetched)
+        if return_numpy:
+            return _float32_array(vectors[0] if single else vectors)
+        return cls._embedding_response(model, vectors, responses)
 
     @classmethod
     def create_completion(
@@ -54,7 +283,7 @@ class OpenAI:
         stop: Optional[Union[str, List[str]]] = None,
         user: Optional[str] = None,
         seed: Optional[int] = None,
-    ) -> OpenAICompletionResponse:
+    ) -> Union[OpenAICompletionResponse, Iterator[OpenAICompletionResponse]]:
         """
         Create a completion for the provided prompt.
 
@@ -65,7 +294,8 @@ class OpenAI:
             temperature: Sampling temperature.
             top_p: Nucleus sampling parameter.
             n: Number of completions to generate.
-            stream: Whether to stream the response.
+            stream: Whether to stream the response. When True, an iterator of
+                OpenAICompletionResponse chunks is returned.
             presence_penalty: Presence penalty value.
             frequency_penalty: Frequency penalty value.
             stop: Stop sequences.
@@ -76,7 +306,7 @@ class OpenAI:
             OpenAICompletionResponse: Completion response in OpenAI format.
         """
         client = get_client()
-        request_data = OpenAICompletionRequest(
+        request_data = cls._completion_request(
             model=model,
             prompt=prompt,
             max_tokens=max_tokens,
@@ -89,10 +319,81 @@ class OpenAI:
             stop=stop,
             user=user,
             seed=seed,
-        ).model_dump(mode="json", exclude_unset=True)
+        )
+        if stream:
+            return _stream_models(
+                client,
+                "v1/completions",
+                request_data,
+                OpenAICompletionResponse,
+                _iter_sse,
+            )
         response = client.request("POST", "v1/completions", json=request_data)
         return OpenAICompletionResponse(**response)
 
+    @classmethod
+    async def acreate_completion(
+        cls,
+        model: str,
+        prompt: Union[str, List[str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        n: Optional[int] = 1,
+        stream: Optional[bool] = False,
+        presence_penalty: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        stop: Optional[Union[str, List[str]]] = None,
+        user: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> Union[OpenAICompletionResponse, AsyncIterator[OpenAICompletionResponse]]:
+        """
+        Asynchronously create a completion for the provided prompt.
+
+        Args:
+            model: Name of the model to use.
+            prompt: Single prompt string or list of prompt strings.
+            max_tokens: Maximum number of tokens to generate.
+            temperature: Sampling temperature.
+            top_p: Nucleus sampling parameter.
+            n: Number of completions to generate.
+            stream: Whether to stream the response. When True, an async iterator of
+                OpenAICompletionResponse chunks is returned.
+            presence_penalty: Presence penalty value.
+            frequency_penalty: Frequency penalty value.
+            stop: Stop sequences.
+            user: Optional user identifier.
+            seed: Random seed for generation.
+
+        Returns:
+            OpenAICompletionResponse: Completion response in OpenAI format.
+        """
+        client = aget_client()
+        request_data = cls._completion_request(
+            model=model,
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            n=n,
+            stream=stream,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            stop=stop,
+            user=user,
+            seed=seed,
+        )
+        if stream:
+            return _astream_models(
+                client,
+                "v1/completions",
+                request_data,
+                OpenAICompletionResponse,
+                _aiter_sse,
+            )
+        response = await client.request("POST", "v1/completions", json=request_data)
+        return OpenAICompletionResponse(**response)
+
     @classmethod
     def create_chat_completion(
         cls,
@@ -108,7 +409,7 @@ class OpenAI:
         frequency_penalty: Optional[float] = None,
         user: Optional[str] = None,
         seed: Optional[int] = None,
-    ) -> OpenAIChatCompletionResponse:
+    ) -> Union[OpenAIChatCompletionResponse, Iterator[OpenAIChatCompletionChunk]]:
         """
         Create a chat completion.
 
@@ -118,7 +419,8 @@ class OpenAI:
             temperature: Sampling temperature.
             top_p: Nucleus sampling parameter.
             n: Number of completions to generate.
-            stream: Whether to stream the response.
+            stream: Whether to stream the response. When True, an iterator of
+                OpenAIChatCompletionChunk chunks is returned.
             stop: Stop sequences.
             max_tokens: Maximum number of tokens to generate.
             presence_penalty: Presence penalty value.
@@ -130,7 +432,7 @@ class OpenAI:
             OpenAIChatCompletionResponse: Chat completion response in OpenAI format.
         """
         client = get_client()
-        request_data = OpenAIChatCompletionRequest(
+        request_data = cls._chat_completion_request(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -143,6 +445,79 @@ class OpenAI:
             frequency_penalty=frequency_penalty,
             user=user,
             seed=seed,
-        ).model_dump(mode="json", exclude_unset=True)
+        )
+        if stream:
+            return _stream_models(
+                client,
+                "v1/chat/completions",
+                request_data,
+                OpenAIChatCompletionChunk,
+                _iter_sse,
+            )
         response = client.request("POST", "v1/chat/completions", json=request_data)
         return OpenAIChatCompletionResponse(**response)
+
+    @classmethod
+    async def acreate_chat_completion(
+        cls,
+        model: str,
+        messages: List[dict],
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        n: Optional[int] = 1,
+        stream: Optional[bool] = False,
+        stop: Optional[Union[str, List[str]]] = None,
+        max_tokens: Optional[int] = None,
+        presence_penalty: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        user: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> Union[OpenAIChatCompletionResponse, AsyncIterator[OpenAIChatCompletionChunk]]:
+        """
+        Asynchronously create a chat completion.
+
+        Args:
+            model: Name of the model to use.
+            messages: List of message dictionaries with 'role' and 'content' keys.
+            temperature: Sampling temperature.
+            top_p: Nucleus sampling parameter.
+            n: Number of completions to generate.
+            stream: Whether to stream the response. When True, an async iterator of
+                OpenAIChatCompletionChunk chunks is returned.
+            stop: Stop sequences.
+            max_tokens: Maximum number of tokens to generate.
+            presence_penalty: Presence penalty value.
+            frequency_penalty: Frequency penalty value.
+            user: Optional user identifier.
+            seed: Random seed for generation.
+
+        Returns:
+            OpenAIChatCompletionResponse: Chat completion response in OpenAI format.
+        """
+        client = aget_client()
+        request_data = cls._chat_completion_request(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            top_p=top_p,
+            n=n,
+            stream=stream,
+            stop=stop,
+            max_tokens=max_tokens,
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
+            user=user,
+            seed=seed,
+        )
+        if stream:
+            return _astream_models(
+                client,
+                "v1/chat/completions",
+                request_data,
+                OpenAIChatCompletionChunk,
+                _aiter_sse,
+            )
+        response = await client.request(
+            "POST", "v1/chat/completions", json=request_data
+        )
+        return OpenAIChatCompletionResponse(**response)
@@ -0,0 +1,25 @@
+from typing import List, Union
+
+
+def _float32_array(vectors: Union[List[float], List[List[float]]]):
+    """
+    Convert embedding vectors to a contiguous float32 numpy array.
+
+    Args:
+        vectors: A single vector, or a list of vectors of equal length.
+
+    Returns:
+        numpy.ndarray: A 1-D array for a single vector, else a 2-D array with one row
+            per vector.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "return_numpy=True requires numpy. "
+            "Install it with `pip install sharpai-sdk-python[numpy]`."
+        ) from e
+    return np.asarray(vectors, dtype=np.float32)
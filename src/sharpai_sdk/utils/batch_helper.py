@@ -0,0 +1,74 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def _check_batching(batch_size: int, max_concurrent_batches: int) -> None:
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer")
+    if max_concurrent_batches <= 0:
+        raise ValueError("max_concurrent_batches must be a positive integer")
+
+
+def _batched(items: Sequence[str], batch_size: int) -> List[List[str]]:
+    return [list(items[i : i + batch_size]) for i in range(0, len(items), batch_size)]
+
+
+def _run_batches(
+    fetch: Callable[[List[str]], List[T]],
+    items: Sequence[str],
+    batch_size: int,
+    max_concurrent_batches: int,
+) -> List[T]:
+    """
+    Send `items` in chunks of `batch_size`, at most `max_concurrent_batches` at a time.
+
+    Args:
+        fetch: Sends one batch and returns one result per item.
+        items: Items to send, in order.
+        batch_size: Maximum number of items per request.
+        max_concurrent_batches: Maximum number of requests in flight.
+
+    Returns:
+        List: The results of every batch, concatenated in input order.
+    """
+    batches = _batched(items, batch_size)
+    if len(batches) == 1:
+        return fetch(batches[0])
+    workers = min(max_concurrent_batches, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(fetch, batches))
+    return [result for batch in results for result in batch]
+
+
+async def _arun_batches(
+    fetch: Callable[[List[str]], Awaitable[List[T]]],
+    items: Sequence[str],
+    batch_size: int,
+    max_concurrent_batches: int,
+) -> List[T]:
+    """
+    Asynchronous counterpart of `_run_batches`.
+
+    Args:
+        fetch: Sends one batch and returns one result per item.
+        items: Items to send, in order.
+        batch_size: Maximum number of items per request.
+        max_concurrent_batches: Maximum number of requests in flight.
+
+    Returns:
+        List: The results of every batch, concatenated in input order.
+    """
+    batches = _batched(items, batch_size)
+    if len(batches) == 1:
+        return await fetch(batches[0])
+    semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+    async def run(batch: List[str]) -> List[T]:
+        async with semaphore:
+            return await fetch(batch)
+
+    results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [result for batch in results for result in batch]
@@ -0,0 +1,45 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is not installed
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize `obj` to compact JSON bytes.
+    Uses orjson when it is installed (including numpy arrays), else the standard library.
+    Payloads orjson rejects but the standard library accepts, such as integers wider
+    than 64 bits, fall back to the standard library.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data: The JSON document.
+
+    Returns:
+        Any: The parsed object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,16 @@
+from typing import Any, Dict
+
+
+def _request_body(**params: Any) -> Dict[str, Any]:
+    """
+    Build a request body from keyword arguments, leaving out those that are None.
+    Used instead of instantiating and dumping the request models, which validates
+    values the SDK is about to send as is.
+
+    Args:
+        **params: Body fields.
+
+    Returns:
+        Dict: The request body.
+    """
+    return {key: value for key, value in params.items() if value is not None}
@@ -0,0 +1,91 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Type
+
+from pydantic import BaseModel
+
+from .json_helper import _json_loads
+
+_SSE_DATA_PREFIX = "data:"
+_SSE_DONE = "[DONE]"
+
+
+def _iter_ndjson(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Parse newline-delimited JSON, as streamed by the Ollama endpoints.
+
+    Args:
+        lines: Lines of the response body.
+
+    Returns:
+        Iterator[dict]: One parsed object per non-empty line.
+    """
+    for line in lines:
+        if line:
+            yield _json_loads(line)
+
+
+def _iter_sse(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Parse server-sent events, as streamed by the OpenAI-compatible endpoints.
+    Only `data:` fields are read and the stream ends at the `[DONE]` sentinel.
+
+    Args:
+        lines: Lines of the response body.
+
+    Returns:
+        Iterator[dict]: One parsed object per data event.
+    """
+    for line in lines:
+        if not line.startswith(_SSE_DATA_PREFIX):
+            continue
+        data = line[len(_SSE_DATA_PREFIX) :].strip()
+        if data == _SSE_DONE:
+            return
+        yield _json_loads(data)
+
+
+async def _aiter_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[dict]:
+    """Asynchronous counterpart of `_iter_ndjson`."""
+    async for line in lines:
+        if line:
+            yield _json_loads(line)
+
+
+async def _aiter_sse(lines: AsyncIterable[str]) -> AsyncIterator[dict]:
+    """Asynchronous counterpart of `_iter_sse`."""
+    async for line in lines:
+        if not line.startswith(_SSE_DATA_PREFIX):
+            continue
+        data = line[len(_SSE_DATA_PREFIX) :].strip()
+        if data == _SSE_DONE:
+            return
+        yield _json_loads(data)
+
+
+def _stream_models(
+    client, url: str, request_data: dict, model: Type[BaseModel], parse=_iter_ndjson
+) -> Iterator[BaseModel]:
+    """
+    POST a streaming request and yield each chunk as `model`.
+
+    Args:
+        client: The BaseClient to send the request with.
+        url: The endpoint URL.
+        request_data: The JSON request body.
+        model: The pydantic model each chunk is parsed into.
+        parse: Line parser, `_iter_ndjson` or `_iter_sse`.
+
+    Returns:
+        Iterator[BaseModel]: Parsed chunks, yielded as soon as they arrive.
+    """
+    with client.stream("POST", url, json=request_data) as response:
+        for chunk in parse(response.iter_lines()):
+            yield model(**chunk)
+
+
+async def _astream_models(
+    client, url: str, request_data: dict, model: Type[BaseModel], parse=_aiter_ndjson
+) -> AsyncIterator[BaseModel]:
+    """Asynchronous counterpart of `_stream_models`, using `_aiter_ndjson`/`_aiter_sse`."""
+    async with client.stream("POST", url, json=request_data) as response:
+        async for chunk in parse(response.aiter_lines()):
+            yield model(**chunk)
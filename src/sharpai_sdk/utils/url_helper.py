@@ -1,4 +1,21 @@
-from urllib.parse import urlencode
+import string
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+from urllib.parse import quote_plus
+
+# Characters `quote_plus` leaves unchanged
+_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "-._~")
+
+
+def _quote_param(value: Any) -> str:
+    """
+    Encode a query key or value like `urlencode`, skipping `quote_plus` when every
+    character is already URL safe (the common case for SDK parameters).
+    """
+    if isinstance(value, bytes):
+        return quote_plus(value)
+    text = str(value)
+    return text if _SAFE_CHARS.issuperset(text) else quote_plus(text)
 
 
 def _get_url_base(cls, *args, **query_params) -> str:
@@ -12,26 +29,26 @@ def _get_url_base(cls, *args, **query_params) -> str:
     Returns:
         str: The constructed URL without version prefix.
     """
-    parts = []
-    remaining_args = [arg for arg in args if arg is not None]
-
-    # Add resource name
-    parts.append(cls.RESOURCE_NAME)
-
-    # Add remaining path components
-    parts.extend(str(arg) for arg in remaining_args)
-
-    # Build URL path
-    path = "/".join(str(part) for part in parts if part)
-
-    # Handle query parameters
-    formatted_params = {k: v for k, v in query_params.items() if v is not None}
-    flags = [k for k, v in query_params.items() if v is None]
-    query_string = urlencode(formatted_params)
-
-    # Append flags directly if they exist
-    if flags:
-        query_string += ("&" if query_string else "") + "&".join(flags)
+    # Resource name followed by the non-empty path components
+    parts = [cls.RESOURCE_NAME] if cls.RESOURCE_NAME else []
+    for arg in args:
+        if arg is not None:
+            segment = str(arg)
+            if segment:
+                parts.append(segment)
+    path = "/".join(parts)
+    if not query_params:
+        return path
+
+    # Encode key=value pairs and append value-less flags as is
+    params = []
+    flags = []
+    for key, value in query_params.items():
+        if value is None:
+            flags.append(key)
+        else:
+            params.append(f"{_quote_param(key)}={_quote_param(value)}")
+    query_string = "&".join(params + flags)
 
     return f"{path}?{query_string}" if query_string else path
 
@@ -55,3 +72,40 @@ def _get_url_v2(cls, *args, **query_params) -> str:
     Get the v2.0 URL for a resource.
     """
     return f"v2.0/{_get_url_base(cls, *args, **query_params)}"
+
+
+@lru_cache(maxsize=None)
+def _base_url_v1(cls, *segments: str) -> str:
+    """
+    Get the cached v1.0 URL for a resource and constant path segments.
+    Only pass values that are fixed per class (e.g. "bulk"); GUIDs and query
+    parameters would grow the cache without bound.
+    """
+    return _get_url_v1(cls, *segments)
+
+
+@lru_cache(maxsize=None)
+def _base_url_v2(cls) -> str:
+    """
+    Get the cached v2.0 URL for a resource.
+    """
+    return _get_url_v2(cls)
+
+
+def _resource_url_v1(cls, guid: Optional[str] = None, flags: Iterable[str] = ()) -> str:
+    """
+    Get the v1.0 URL for a resource instance from the cached base URL.
+    Equivalent to `_get_url_v1(cls, guid, **{flag: None for flag in flags})`.
+
+    Args:
+        guid: Optional resource GUID appended as a path segment.
+        flags: Value-less query flags (e.g. "incldata").
+
+    Returns:
+        str: The constructed v1.0 URL.
+    """
+    url = _base_url_v1(cls)
+    if guid is not None and guid != "":
+        url = f"{url}{guid}" if url.endswith("/") else f"{url}/{guid}"
+    query_string = "&".join(flags)
+    return f"{url}?{query_string}" if query_string else url
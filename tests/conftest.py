@@ -13,4 +13,12 @@ src_path = Path(__file__).parent.parent / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-# import pytest
+import pytest  # noqa: E402
+
+from sharpai_sdk.configuration import configure  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configured():
+    """Configure the SDK once for the whole session."""
+    configure(endpoint="http://localhost:8000", timeout=10, retries=3)
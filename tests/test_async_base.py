@@ -0,0 +1,79 @@
+"""Tests for async_base.py."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from sharpai_sdk.async_base import AsyncBaseClient
+from sharpai_sdk.exceptions import SdkException
+
+
+@pytest.fixture
+def base_url():
+    return "http://test-api.com"
+
+
+@pytest.fixture
+def async_client(base_url):
+    """Create an async base client for testing."""
+    return AsyncBaseClient(base_url=base_url, timeout=10, retries=3)
+
+
+def _json_response(data):
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(data).encode()
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
+
+def test_async_client_is_built_once(async_client):
+    """Test the async HTTP client is created lazily and reused."""
+    with patch("httpx.AsyncClient") as mock_client_cls:
+        first = async_client.client
+        second = async_client.client
+        assert first is second
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args[1]["limits"] is async_client.limits
+
+
+def test_async_successful_request(async_client):
+    """Test successful async request with JSON response."""
+    mock_request = AsyncMock(return_value=_json_response({"data": "test"}))
+    with patch.object(async_client.client, "request", mock_request):
+        response = asyncio.run(async_client.request("GET", "/test"))
+        assert response == {"data": "test"}
+        assert "Content-Type" in mock_request.call_args[1]["headers"]
+
+
+def test_async_request_with_retry_success(async_client):
+    """Test async request that succeeds after retries."""
+    mock_request = AsyncMock(
+        side_effect=[
+            httpx.RequestError("First attempt failed"),
+            _json_response({"data": "success"}),
+        ]
+    )
+    with patch.object(async_client.client, "request", mock_request):
+        response = asyncio.run(async_client.request("GET", "/test"))
+        assert response == {"data": "success"}
+        assert mock_request.call_count == 2
+
+
+def test_async_request_max_retries_exhausted(async_client):
+    """Test async request fails after max retries with RequestError."""
+    mock_request = AsyncMock(side_effect=httpx.RequestError("Connection failed"))
+    with patch.object(async_client.client, "request", mock_request):
+        with pytest.raises(SdkException, match="Request failed after 3 attempts"):
+            asyncio.run(async_client.request("GET", "/test"))
+
+
+def test_async_client_close(async_client):
+    """Test async client close method."""
+    mock_close = AsyncMock()
+    async_client.client.aclose = mock_close
+    asyncio.run(async_client.close())
+    mock_close.assert_awaited_once()
@@ -1,4 +1,7 @@
-from unittest.mock import Mock, patch
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, Mock, patch
 
 import httpx
 import pytest
@@ -15,8 +18,7 @@ def base_url():
 @pytest.fixture
 def base_client(base_url):
     """Create a base client for testing."""
-    with patch("httpx.Client"):
-        return BaseClient(base_url=base_url, timeout=10, retries=3)
+    return BaseClient(base_url=base_url, timeout=10, retries=3)
 
 
 @pytest.fixture
@@ -44,17 +46,16 @@ def mock_httpx_client(monkeypatch):
 
 def test_client_initialization(base_url):
     """Test client initialization with different parameters."""
-    with patch("httpx.Client"):
-        # Test default values
-        client = BaseClient(base_url=base_url)
-        assert client.base_url == base_url
-        assert client.timeout == 10
-        assert client.retries == 3
-        # Test custom values
-        custom_client = BaseClient(base_url=base_url, timeout=20, retries=5)
-        assert custom_client.base_url == base_url
-        assert custom_client.timeout == 20
-        assert custom_client.retries == 5
+    # Test default values
+    client = BaseClient(base_url=base_url)
+    assert client.base_url == base_url
+    assert client.timeout == 10
+    assert client.retries == 3
+    # Test custom values
+    custom_client = BaseClient(base_url=base_url, timeout=20, retries=5)
+    assert custom_client.base_url == base_url
+    assert custom_client.timeout == 20
+    assert custom_client.retries == 5
 
 
 def test_successful_request(base_client, monkeypatch):
@@ -101,6 +102,33 @@ def test_request_with_headers(base_client, monkeypatch):
         assert call_kwargs["headers"]["Custom-Header"] == "value"
 
 
+def test_request_with_raw_json(base_client):
+    """Test a pre-serialized JSON body is sent as content."""
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b""
+    mock_response.raise_for_status.return_value = None
+
+    mock_request = Mock(return_value=mock_response)
+    with patch.object(base_client.client, "request", mock_request):
+        base_client.request("POST", "/test", raw_json=b'{"a":1}')
+
+        call_kwargs = mock_request.call_args[1]
+        assert call_kwargs["content"] == b'{"a":1}'
+        assert "json" not in call_kwargs
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+
+
+def test_request_without_raise_for_status(base_client):
+    """Test the raw response is returned for error statuses when not raising."""
+    request = httpx.Request("HEAD", "http://test-api.com/test")
+    not_found = httpx.Response(404, request=request)
+
+    with patch.object(base_client.client, "request", Mock(return_value=not_found)):
+        response = base_client.request("HEAD", "/test", raise_for_status=False)
+        assert response is not_found
+
+
 def test_client_close(base_client):
     """Test client close method."""
     mock_close = Mock()
@@ -141,6 +169,16 @@ def test_request_max_retries_exhausted(base_client, monkeypatch):
         )
 
 
+def test_request_without_decoding(base_client):
+    """Test decode=False returns the raw response body."""
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+    mock_response.raise_for_status.return_value = None
+    with patch.object(base_client.client, "request", return_value=mock_response):
+        assert base_client.request("GET", "/test", decode=False) == b'{"data": "test"}'
+
+
 def test_request_with_json_payload(base_client, monkeypatch):
     """Test request with JSON payload."""
     mock_response = Mock(spec=httpx.Response)
@@ -154,4 +192,108 @@ def test_request_with_json_payload(base_client, monkeypatch):
         base_client.request("POST", "/test", json=payload)
         mock_request.assert_called_once()
         call_kwargs = mock_request.call_args[1]
-        assert call_kwargs["json"] == payload
+        assert "json" not in call_kwargs
+        assert json.loads(call_kwargs["content"]) == payload
+
+
+def test_request_with_int_key_json_payload(base_client):
+    """Test a JSON payload with non-string keys is sent as the standard library would."""
+    mock_response = Mock(spec=httpx.Response, status_code=200, content=b"{}")
+    mock_request = Mock(return_value=mock_response)
+    with patch.object(base_client.client, "request", mock_request):
+        base_client.request("POST", "/test", json={1: "value"})
+    assert mock_request.call_args[1]["content"] == b'{"1":"value"}'
+
+
+def test_client_is_built_once_with_pool_limits(base_url):
+    """Test the HTTP client is created lazily with pool limits and then reused."""
+    with patch("httpx.Client") as mock_client_cls:
+        client = BaseClient(
+            base_url=base_url,
+            max_keepalive_connections=5,
+            max_connections=10,
+            keepalive_expiry=15.0,
+        )
+        mock_client_cls.assert_not_called()
+
+        first = client.client
+        second = client.client
+
+        assert first is second
+        mock_client_cls.assert_called_once()
+        limits = mock_client_cls.call_args[1]["limits"]
+        assert limits.max_keepalive_connections == 5
+        assert limits.max_connections == 10
+        assert limits.keepalive_expiry == 15.0
+        assert mock_client_cls.call_args[1]["http2"] is False
+
+
+def test_client_is_built_once_across_threads(base_url):
+    """Test concurrent first use builds a single HTTP client."""
+    client = BaseClient(base_url=base_url)
+
+    def build(**kwargs):
+        time.sleep(0.01)
+        return object()
+
+    with patch("httpx.Client", side_effect=build) as mock_client_cls:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: client.client, range(8)))
+
+    mock_client_cls.assert_called_once()
+    assert all(c is clients[0] for c in clients)
+
+
+def test_client_http2(base_url):
+    """Test the http2 flag is forwarded to the HTTP client."""
+    with patch("httpx.Client") as mock_client_cls:
+        BaseClient(base_url=base_url, http2=True).client
+        assert mock_client_cls.call_args[1]["http2"] is True
+
+
+def test_client_uses_injected_httpx_client(base_url):
+    """Test a user supplied httpx client is used instead of building one."""
+    injected = Mock(spec=httpx.Client)
+    with patch("httpx.Client") as mock_client_cls:
+        client = BaseClient(base_url=base_url, httpx_client=injected)
+        assert client.client is injected
+        mock_client_cls.assert_not_called()
+
+
+def test_stream_yields_open_response(base_client):
+    """Test stream yields the streaming response without reading it."""
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.is_error = False
+    mock_stream = MagicMock()
+    mock_stream.return_value.__enter__.return_value = mock_response
+
+    with patch.object(base_client.client, "stream", mock_stream):
+        with base_client.stream("POST", "/test", json={"a": 1}) as response:
+            assert response is mock_response
+        call_kwargs = mock_stream.call_args[1]
+        assert json.loads(call_kwargs["content"]) == {"a": 1}
+        assert "Content-Type" in call_kwargs["headers"]
+        mock_response.read.assert_not_called()
+
+
+def test_stream_error_status(base_client):
+    """Test stream raises the SDK exception for an error status."""
+    request = httpx.Request("POST", "http://test-api.com/test")
+    error_response = httpx.Response(500, content=b"boom", request=request)
+    mock_stream = MagicMock()
+    mock_stream.return_value.__enter__.return_value = error_response
+
+    with patch.object(base_client.client, "stream", mock_stream):
+        with pytest.raises(SdkException, match="non-JSON content"):
+            with base_client.stream("POST", "/test"):
+                pass
+
+
+def test_stream_request_error(base_client):
+    """Test stream wraps transport errors in SdkException."""
+    with patch.object(
+        base_client.client, "stream", side_effect=httpx.ConnectError("refused")
+    ):
+        with pytest.raises(SdkException, match="Streaming request failed"):
+            with base_client.stream("POST", "/test"):
+                pass
@@ -1,5 +1,6 @@
 """Extended tests for base.py to improve coverage."""
 
+import json
 from unittest.mock import Mock, patch
 
 import httpx
@@ -18,8 +19,7 @@ def base_url():
 @pytest.fixture
 def base_client(base_url):
     """Create a base client for testing."""
-    with patch("httpx.Client"):
-        return BaseClient(base_url=base_url, timeout=10, retries=3)
+    return BaseClient(base_url=base_url, timeout=10, retries=3)
 
 
 def test_handle_response_json_decode_error(base_client, monkeypatch):
@@ -28,7 +28,6 @@ def test_handle_response_json_decode_error(base_client, monkeypatch):
     mock_response.status_code = 200
     mock_response.content = b"Not valid JSON"
     mock_response.raise_for_status.return_value = None
-    mock_response.json.side_effect = ValueError("Invalid JSON")
 
     result = base_client._handle_response(mock_response)
     assert result == b"Not valid JSON"
@@ -42,7 +41,7 @@ def test_handle_error_response_json(base_client, monkeypatch):
     }
     mock_response = Mock(spec=httpx.Response)
     mock_response.headers = {"Content-Type": "application/json"}
-    mock_response.json.return_value = error_response_data
+    mock_response.content = json.dumps(error_response_data).encode()
 
     mock_error = Mock(spec=httpx.HTTPStatusError)
     mock_error.response = mock_response
@@ -73,7 +72,7 @@ def test_request_with_http_status_error_json(base_client, monkeypatch):
     mock_response = Mock(spec=httpx.Response)
     mock_response.status_code = 404
     mock_response.headers = {"Content-Type": "application/json"}
-    mock_response.json.return_value = error_response_data
+    mock_response.content = json.dumps(error_response_data).encode()
 
     mock_error = httpx.HTTPStatusError(
         "404 Not Found", request=Mock(spec=httpx.Request), response=mock_response
@@ -89,8 +88,8 @@ def test_request_with_http_status_error_value_error(base_client, monkeypatch):
     mock_response = Mock(spec=httpx.Response)
     mock_response.status_code = 500
     mock_response.headers = {"Content-Type": "application/json"}
-    # Make json() raise ValueError to trigger the ValueError handler
-    mock_response.json.side_effect = ValueError("Invalid JSON")
+    # Invalid JSON raises ValueError to trigger the ValueError handler
+    mock_response.content = b"Invalid JSON"
 
     mock_error = httpx.HTTPStatusError(
         "500 Internal Server Error",
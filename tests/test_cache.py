@@ -0,0 +1,151 @@
+import pytest
+
+from sharpai_sdk.cache import InMemoryEmbeddingCache, _fill_uncached, _find_uncached
+from sharpai_sdk.exceptions import SdkException
+
+
+def test_get_and_set():
+    """Test storing and retrieving embeddings per model."""
+    cache = InMemoryEmbeddingCache()
+    cache.set("model-a", "hello", [0.1, 0.2])
+
+    assert cache.get("model-a", "hello") == [0.1, 0.2]
+    assert cache.get("model-b", "hello") is None
+    assert cache.get("model-a", "other") is None
+    assert len(cache) == 1
+
+
+def test_evicts_least_recently_used():
+    """Test the least recently used entry is evicted once maxsize is reached."""
+    cache = InMemoryEmbeddingCache(maxsize=2)
+    cache.set("m", "a", [1.0])
+    cache.set("m", "b", [2.0])
+    cache.get("m", "a")
+    cache.set("m", "c", [3.0])
+
+    assert cache.get("m", "a") == [1.0]
+    assert cache.get("m", "b") is None
+    assert cache.get("m", "c") == [3.0]
+    assert len(cache) == 2
+
+
+def test_clear():
+    """Test clearing the cache."""
+    cache = InMemoryEmbeddingCache()
+    cache.set("m", "a", [1.0])
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_invalid_maxsize():
+    """Test non-positive size bounds are rejected."""
+    with pytest.raises(ValueError):
+        InMemoryEmbeddingCache(maxsize=0)
+    with pytest.raises(ValueError):
+        InMemoryEmbeddingCache(max_bytes=0)
+
+
+def test_find_and_fill_uncached():
+    """Test cached vectors are stitched together with fetched ones in order."""
+    cache = InMemoryEmbeddingCache()
+    cache.set("m", "b", [2.0])
+    texts = ["a", "b", "c"]
+
+    vectors, misses = _find_uncached(cache, "m", texts)
+    assert vectors == [None, [2.0], None]
+    assert misses == [0, 2]
+
+    _fill_uncached(cache, "m", texts, vectors, misses, [[1.0], [3.0]])
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert cache.get("m", "c") == [3.0]
+
+
+def test_fill_uncached_count_mismatch():
+    """Test a server response with the wrong number of embeddings is rejected."""
+    cache = InMemoryEmbeddingCache()
+    with pytest.raises(SdkException, match="Expected 2 embeddings"):
+        _fill_uncached(cache, "m", ["a", "b"], [None, None], [0, 1], [[1.0]])
+
+
+def test_evicts_by_total_bytes():
+    """Test entries are evicted once the stored vectors exceed max_bytes."""
+    cache = InMemoryEmbeddingCache(max_bytes=64)
+    cache.set("m", "a", [1.0] * 4)
+    cache.set("m", "b", [2.0] * 4)
+    assert cache.nbytes == 64
+
+    cache.set("m", "c", [3.0] * 4)
+    assert cache.get("m", "a") is None
+    assert cache.get("m", "c") == [3.0] * 4
+    assert cache.nbytes == 64
+
+    cache.set("m", "too-big", [0.0] * 9)
+    assert cache.get("m", "too-big") is None
+    assert len(cache) == 2
+
+
+def test_oversized_overwrite_drops_stale_entry():
+    """Test overwriting a key with a vector above max_bytes evicts the old one."""
+    cache = InMemoryEmbeddingCache(max_bytes=64, fuzzy_threshold=0.9)
+    cache.set("m", "a", [1.0] * 4)
+    cache.set("m", "b", [2.0] * 4)
+
+    cache.set("m", "a", [0.0] * 20)
+    assert cache.get("m", "a") is None
+    assert cache.get("m", "b") == [2.0] * 4
+    assert len(cache) == 1
+    assert cache.nbytes == 32
+
+
+def test_reduced_precision_storage():
+    """Test float16 storage halves the size again at reduced precision."""
+    cache = InMemoryEmbeddingCache(dtype="float16")
+    cache.set("m", "a", [0.1234, -0.5, 2.0])
+
+    assert cache.nbytes == 6
+    assert cache.get("m", "a") == pytest.approx([0.1234, -0.5, 2.0], abs=1e-3)
+
+
+def test_invalid_dtype():
+    """Test an unsupported storage dtype is rejected."""
+    with pytest.raises(ValueError, match="dtype"):
+        InMemoryEmbeddingCache(dtype="int8")
+
+
+def test_normalize_shares_entries():
+    """Test normalized keys ignore casing, punctuation and whitespace."""
+    cache = InMemoryEmbeddingCache(normalize=True)
+    cache.set("m", "Hello, SharpAI!", [1.0])
+
+    assert cache.get("m", "hello   sharpai") == [1.0]
+    assert len(cache) == 1
+    assert InMemoryEmbeddingCache().get("m", "hello sharpai") is None
+
+
+def test_fuzzy_lookup():
+    """Test a near-duplicate short input hits the closest entry of the same model."""
+    cache = InMemoryEmbeddingCache(fuzzy_threshold=0.95)
+    cache.set("m", "the quick brown fox jumps over the lazy dog", [1.0])
+
+    assert cache.get("m", "the quick brown fox jumps over the lazy dogs") == [1.0]
+    assert cache.get("other", "the quick brown fox jumps over the lazy dogs") is None
+    assert cache.get("m", "an entirely different sentence") is None
+
+
+def test_fuzzy_index_follows_eviction():
+    """Test evicted and cleared entries are no longer fuzzy matches."""
+    cache = InMemoryEmbeddingCache(maxsize=1, fuzzy_threshold=0.9)
+    cache.set("m", "the quick brown fox", [1.0])
+    cache.set("m", "a completely unrelated text", [2.0])
+
+    assert cache.get("m", "the quick brown fox!") is None
+    assert cache.get("m", "a completely unrelated text!") == [2.0]
+    cache.clear()
+    assert cache.get("m", "a completely unrelated text!") is None
+    assert cache._buckets == {}
+
+
+def test_invalid_fuzzy_threshold():
+    """Test an out of range fuzzy threshold is rejected."""
+    with pytest.raises(ValueError):
+        InMemoryEmbeddingCache(fuzzy_threshold=1.5)
@@ -1,50 +1,137 @@
 import pytest
 
+import sharpai_sdk.configuration as config_module
 from sharpai_sdk.configuration import configure, get_client
 
 
-def test_configure():
-    """Test SDK configuration."""
+@pytest.fixture(scope="module")
+def preconfigured_clients():
+    """Clients built by two successive configure calls, shared by the module."""
     configure(endpoint="http://localhost:8000", timeout=10, retries=3)
-    client = get_client()
+    first = get_client()
+    configure(endpoint="http://localhost:9000", timeout=20, retries=5)
+    second = get_client()
+    return first, second
+
+
+def test_configure(preconfigured_clients):
+    """Test SDK configuration."""
+    client, _ = preconfigured_clients
     assert client.base_url == "http://localhost:8000"
     assert client.timeout == 10
     assert client.retries == 3
 
 
-def test_configure_custom_timeout():
+def test_configure_custom_timeout(preconfigured_clients):
     """Test SDK configuration with custom timeout."""
-    configure(endpoint="http://localhost:8000", timeout=30, retries=5)
-    client = get_client()
-    assert client.timeout == 30
+    _, client = preconfigured_clients
+    assert client.timeout == 20
     assert client.retries == 5
 
 
-def test_get_client_before_configure():
+def test_get_client_before_configure(monkeypatch):
     """Test getting client before configuration raises error."""
-    # Reset global client
-    import sharpai_sdk.configuration as config_module
-
-    config_module._client = None
+    monkeypatch.setattr(config_module, "_client", None)
 
     with pytest.raises(ValueError, match="SDK is not configured"):
         get_client()
 
-    # Reconfigure for other tests
-    configure(endpoint="http://localhost:8000")
 
-
-def test_configure_multiple_times():
+def test_configure_multiple_times(preconfigured_clients):
     """Test that configure can be called multiple times."""
-    configure(endpoint="http://localhost:8000", timeout=10)
-    client1 = get_client()
-
-    configure(endpoint="http://localhost:9000", timeout=20)
-    client2 = get_client()
+    client1, client2 = preconfigured_clients
 
-    # After reconfiguration, get_client() should return the new client
-    # with updated configuration
+    # Reconfiguring builds a new client with the updated configuration
     assert client2.base_url == "http://localhost:9000"
     assert client2.timeout == 20
-    # The new client should have different configuration than the old one
     assert client1.base_url != client2.base_url
+
+
+def test_configure_pool_settings():
+    """Test that connection pool settings are forwarded to the client."""
+    configure(
+        endpoint="http://localhost:8000",
+        max_keepalive_connections=4,
+        max_connections=8,
+        keepalive_expiry=5.0,
+    )
+    client = get_client()
+    assert client.limits.max_keepalive_connections == 4
+    assert client.limits.max_connections == 8
+    assert client.limits.keepalive_expiry == 5.0
+    assert client.http2 is False
+
+
+def test_configure_http2():
+    """Test that the http2 flag is forwarded to the client."""
+    configure(endpoint="http://localhost:8000", http2=True)
+    assert get_client().http2 is True
+
+
+def test_aconfigure():
+    """Test async SDK configuration."""
+    from sharpai_sdk.async_base import AsyncBaseClient
+    from sharpai_sdk.configuration import aconfigure, aget_client
+
+    aconfigure(endpoint="http://localhost:8000", timeout=15, retries=2)
+    client = aget_client()
+    assert isinstance(client, AsyncBaseClient)
+    assert client.timeout == 15
+    assert client.retries == 2
+
+
+def test_aget_client_before_aconfigure(monkeypatch):
+    """Test getting the async client before configuration raises error."""
+    from sharpai_sdk.configuration import aget_client
+
+    monkeypatch.setattr(config_module, "_async_client", None)
+
+    with pytest.raises(ValueError, match="SDK async client is not configured"):
+        aget_client()
+
+
+def test_configure_embedding_cache():
+    """Test the embedding cache is opt-in and replaced on reconfiguration."""
+    from sharpai_sdk.cache import InMemoryEmbeddingCache
+    from sharpai_sdk.configuration import get_embedding_cache
+
+    cache = InMemoryEmbeddingCache()
+    configure(endpoint="http://localhost:8000", embedding_cache=cache)
+    assert get_embedding_cache() is cache
+
+    configure(endpoint="http://localhost:8000")
+    assert get_embedding_cache() is None
+
+
+def test_configure_context_local():
+    """Test a context-local configuration does not leak into other contexts."""
+    import contextvars
+
+    configure(endpoint="http://global:8000")
+
+    def configure_locally():
+        configure(endpoint="http://local:8000", context_local=True)
+        return get_client()
+
+    local_client = contextvars.copy_context().run(configure_locally)
+    assert local_client.base_url == "http://local:8000"
+    assert get_client().base_url == "http://global:8000"
+
+
+def test_aconfigure_context_local_per_task():
+    """Test each asyncio task can hold its own async client."""
+    import asyncio
+
+    from sharpai_sdk.configuration import aconfigure, aget_client
+
+    async def configure_task(endpoint):
+        aconfigure(endpoint=endpoint, context_local=True)
+        await asyncio.sleep(0)
+        return aget_client().base_url
+
+    async def run():
+        return await asyncio.gather(
+            configure_task("http://one:8000"), configure_task("http://two:8000")
+        )
+
+    assert asyncio.run(run()) == ["http://one:8000", "http://two:8000"]
@@ -1,33 +1,74 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from sharpai_sdk.configuration import configure
+from sharpai_sdk.async_base import AsyncBaseClient
+from sharpai_sdk.base import BaseClient
+from sharpai_sdk.exceptions import SdkException
+from sharpai_sdk.resources import connectivity as _conn_mod
 from sharpai_sdk.resources.connectivity import Connectivity
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
-    """Create a mock client for testing."""
-    configure(endpoint="http://localhost:8000")
-    client = Mock()
-    with patch("sharpai_sdk.resources.connectivity.get_client", return_value=client):
+    """Create a mock client shared by the module."""
+    client = Mock(spec_set=BaseClient)
+    with patch.object(_conn_mod, "get_client", return_value=client):
         yield client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_client):
+    """Reset the shared mock client after each test."""
+    yield
+    mock_client.request.reset_mock(return_value=True, side_effect=True)
+
+
 def test_validate_success(mock_client):
     """Test successful connectivity validation."""
-    mock_client.request.return_value = None
+    mock_client.request.return_value = Mock(status_code=200)
 
     result = Connectivity.validate()
     assert result is True
-    mock_client.request.assert_called_once_with("HEAD", "")
+    mock_client.request.assert_called_once_with("HEAD", "", raise_for_status=False)
 
 
 def test_validate_failure(mock_client):
     """Test failed connectivity validation."""
-    mock_client.request.side_effect = Exception("Connection failed")
+    mock_client.request.side_effect = SdkException("Connection failed")
 
     result = Connectivity.validate()
     assert result is False
-    mock_client.request.assert_called_once_with("HEAD", "")
+    mock_client.request.assert_called_once_with("HEAD", "", raise_for_status=False)
+
+
+@pytest.mark.parametrize("status_code, expected", [(404, True), (503, False)])
+def test_validate_status_code(mock_client, status_code, expected):
+    """Test any response below 500 counts as reachable."""
+    mock_client.request.return_value = Mock(status_code=status_code)
+    assert Connectivity.validate() is expected
+
+
+def test_validate_does_not_swallow_unexpected_errors(mock_client):
+    """Test errors other than request failures propagate."""
+    mock_client.request.side_effect = KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        Connectivity.validate()
+
+
+def test_avalidate_success():
+    """Test successful async connectivity validation."""
+    client = Mock(spec_set=AsyncBaseClient)
+    client.request = AsyncMock(return_value=Mock(status_code=200))
+    with patch.object(_conn_mod, "aget_client", return_value=client):
+        assert asyncio.run(Connectivity.avalidate()) is True
+    client.request.assert_awaited_once_with("HEAD", "", raise_for_status=False)
+
+
+def test_avalidate_failure():
+    """Test failed async connectivity validation."""
+    client = Mock(spec_set=AsyncBaseClient)
+    client.request = AsyncMock(side_effect=SdkException("Connection failed"))
+    with patch.object(_conn_mod, "aget_client", return_value=client):
+        assert asyncio.run(Connectivity.avalidate()) is False
@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+import pytest
+
+from sharpai_sdk.utils import json_helper
+from sharpai_sdk.utils.json_helper import _json_dumps, _json_loads
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(use_orjson):
+    """Test JSON encoding with and without orjson installed."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    data = {"Query": "test", "IncludeData": True, "Values": [1, 2.5, None]}
+
+    with patch.object(
+        json_helper, "orjson", json_helper.orjson if use_orjson else None
+    ):
+        encoded = _json_dumps(data)
+        assert isinstance(encoded, bytes)
+        assert encoded == b'{"Query":"test","IncludeData":true,"Values":[1,2.5,null]}'
+        assert _json_loads(encoded) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps_matches_stdlib_inputs(use_orjson):
+    """Test int keys and integers wider than 64 bits encode with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+
+    with patch.object(
+        json_helper, "orjson", json_helper.orjson if use_orjson else None
+    ):
+        assert _json_dumps({1: "a"}) == b'{"1":"a"}'
+        assert _json_dumps({"n": 2**64}) == b'{"n":18446744073709551616}'
+
+
+def test_json_dumps_numpy():
+    """Test numpy arrays are serialized without converting them to lists first."""
+    pytest.importorskip("orjson")
+    np = pytest.importorskip("numpy")
+
+    assert _json_dumps({"v": np.array([1.0, 2.0])}) == b'{"v":[1.0,2.0]}'
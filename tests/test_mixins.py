@@ -1,11 +1,14 @@
 """Tests for mixins.py to improve coverage."""
 
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from pydantic import BaseModel
 
-from sharpai_sdk.configuration import configure, get_client
+from sharpai_sdk.async_base import AsyncBaseClient
+from sharpai_sdk.configuration import get_client
+from sharpai_sdk.exceptions import SdkException
 from sharpai_sdk.mixins import (
     AllRetrievableAPIResource,
     CreateableAPIResource,
@@ -22,6 +25,30 @@ from sharpai_sdk.models.enumeration_query import EnumerationQueryModel
 from sharpai_sdk.models.enumeration_result import EnumerationResultModel
 
 
+# Empty enumeration page shared by the search and enumerate tests; never mutated.
+_EMPTY_ENUM_RESPONSE = {
+    "Success": True,
+    "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
+    "MaxResults": 1000,
+    "IterationsRequired": 0,
+    "ContinuationToken": None,
+    "EndOfResults": True,
+    "TotalRecords": 0,
+    "RecordsRemaining": 0,
+    "Objects": [],
+}
+
+
+def _method(request_mock):
+    """Return the HTTP method of the last call to `request_mock`."""
+    return request_mock.call_args.args[0]
+
+
+def _url(request_mock):
+    """Return the URL of the last call to `request_mock`."""
+    return request_mock.call_args.args[1]
+
+
 # Test model classes
 class TestModel(BaseModel):
     """Test model for mixin tests."""
@@ -31,6 +58,16 @@ class TestModel(BaseModel):
     value: int = 0
 
 
+# Prebuilt models and their serialized forms, returned by the mocked request.
+_TEST_MODEL_NEW = TestModel(id="new-id", name="created", value=10)
+_TEST_MODEL_NEW_DICT = _TEST_MODEL_NEW.model_dump()
+_TEST_MODELS = [
+    TestModel(id="id1", name="test1", value=1),
+    TestModel(id="id2", name="test2", value=2),
+]
+_TEST_MODELS_DICTS = [model.model_dump() for model in _TEST_MODELS]
+
+
 class TestResourceModel(BaseModel):
     """Test resource model."""
 
@@ -38,13 +75,20 @@ class TestResourceModel(BaseModel):
     data: dict = {}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
-    """Create a mock client."""
-    with patch("httpx.Client"):
-        configure("http://test-api.com")
-        client = get_client()
-        return client
+    """Create a client shared by the module, with a mocked request method."""
+    client = get_client()
+    with patch.object(client, "request"):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_client, mock_async_client):
+    """Reset the shared clients' request mocks after each test."""
+    yield
+    mock_client.request.reset_mock(return_value=True, side_effect=True)
+    mock_async_client.request.reset_mock(return_value=True, side_effect=True)
 
 
 # ExistsAPIResource tests
@@ -56,19 +100,26 @@ class TestExistsResource(ExistsAPIResource):
 
 def test_exists_resource_success(mock_client):
     """Test exists method returns True when resource exists."""
-    with patch.object(mock_client, "request", return_value=None):
-        result = TestExistsResource.exists("test-guid")
-        assert result is True
-        mock_client.request.assert_called_once_with(
-            "HEAD", "v1.0/test-resource/test-guid"
-        )
+    mock_client.request.return_value = Mock(status_code=200)
+    result = TestExistsResource.exists("test-guid")
+    assert result is True
+    mock_client.request.assert_called_once_with(
+        "HEAD", "v1.0/test-resource/test-guid", raise_for_status=False
+    )
 
 
 def test_exists_resource_not_found(mock_client):
     """Test exists method returns False when resource doesn't exist."""
-    with patch.object(mock_client, "request", side_effect=Exception("Not found")):
-        result = TestExistsResource.exists("test-guid")
-        assert result is False
+    mock_client.request.return_value = Mock(status_code=404)
+    result = TestExistsResource.exists("test-guid")
+    assert result is False
+
+
+def test_exists_resource_network_error(mock_client):
+    """Test exists method propagates network failures."""
+    mock_client.request.side_effect = SdkException("Request failed")
+    with pytest.raises(SdkException):
+        TestExistsResource.exists("test-guid")
 
 
 # CreateableAPIResource tests
@@ -87,64 +138,71 @@ class TestCreateableResourceNoModel(CreateableAPIResource):
     MODEL = None
 
 
-def test_create_resource_with_model(mock_client):
-    """Test create method with MODEL."""
-    response_data = {"id": "new-id", "name": "created", "value": 10}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestCreateableResource.create(id="new-id", name="created", value=10)
-        assert isinstance(result, TestModel)
-        assert result.id == "new-id"
-        assert result.name == "created"
-        assert result.value == 10
-
-
-def test_create_resource_without_model(mock_client):
-    """Test create method without MODEL."""
-    response_data = {"id": "new-id", "name": "created"}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestCreateableResourceNoModel.create(id="new-id", name="created")
-        assert result == response_data
+@pytest.mark.parametrize(
+    "cls, expected",
+    [
+        (TestCreateableResource, _TEST_MODEL_NEW),
+        (TestCreateableResourceNoModel, _TEST_MODEL_NEW_DICT),
+    ],
+    ids=["with_model", "without_model"],
+)
+def test_create_resource(mock_client, cls, expected):
+    """Test create parses the response with MODEL, or returns it as is without one."""
+    mock_client.request.return_value = _TEST_MODEL_NEW_DICT
+    result = cls.create(id="new-id", name="created", value=10)
+    assert result == expected
 
 
 def test_create_resource_with_headers(mock_client):
     """Test create method with custom headers."""
     response_data = {"id": "new-id", "name": "created", "value": 5}
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        _ = TestCreateableResource.create(
-            id="new-id", headers={"Custom-Header": "value"}
-        )
-        call_kwargs = mock_request.call_args[1]
-        assert "headers" in call_kwargs
-        assert call_kwargs["headers"]["Custom-Header"] == "value"
+    mock_client.request.return_value = response_data
+    _ = TestCreateableResource.create(id="new-id", headers={"Custom-Header": "value"})
+    call_kwargs = mock_client.request.call_args[1]
+    assert "headers" in call_kwargs
+    assert call_kwargs["headers"]["Custom-Header"] == "value"
 
 
 def test_create_resource_with_data_param(mock_client):
     """Test create method with _data parameter."""
     response_data = {"id": "new-id", "name": "created", "value": 5}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestCreateableResource.create(
-            _data={"id": "new-id", "name": "created"}
-        )
-        assert isinstance(result, TestModel)
+    mock_client.request.return_value = response_data
+    result = TestCreateableResource.create(_data={"id": "new-id", "name": "created"})
+    assert isinstance(result, TestModel)
 
 
-def test_create_resource_post_method(mock_client):
-    """Test create method with POST method."""
+def test_create_resource_sends_serialized_model(mock_client):
+    """Test create serializes the model straight to JSON bytes."""
+    response_data = {"id": "new-id", "name": "created", "value": 5}
+    mock_client.request.return_value = response_data
+    TestCreateableResource.create(id="new-id", value=5)
+    call_kwargs = mock_client.request.call_args[1]
+    assert call_kwargs["raw_json"] == b'{"id":"new-id","value":5}'
+    assert "json" not in call_kwargs
+
+
+def test_create_resource_without_response_validation(mock_client):
+    """Test create returns the raw response when validation is skipped."""
+    response_data = {"id": "new-id", "name": "created", "value": 5}
+    mock_client.request.return_value = response_data
+    result = TestCreateableResource.create(validate_response=False, id="new-id")
+    assert result is response_data
+
+
+class TestCreateableResourcePOST(CreateableAPIResource):
+    """Test resource created with POST."""
+
+    RESOURCE_NAME = "test-resource"
+    MODEL = TestModel
+    CREATE_METHOD = "POST"
 
-    class TestCreateableResourcePOST(CreateableAPIResource):
-        RESOURCE_NAME = "test-resource"
-        MODEL = TestModel
-        CREATE_METHOD = "POST"
 
+def test_create_resource_post_method(mock_client):
+    """Test create method with POST method."""
     response_data = {"id": "new-id", "name": "created", "value": 5}
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestCreateableResourcePOST.create(id="new-id")
-        call_args = mock_request.call_args[0]
-        assert call_args[0] == "POST"
+    mock_client.request.return_value = response_data
+    TestCreateableResourcePOST.create(id="new-id")
+    assert _method(mock_client.request) == "POST"
 
 
 # CreateableMultipleAPIResource tests
@@ -162,30 +220,40 @@ class TestCreateableMultipleResourceNoModel(CreateableMultipleAPIResource):
     MODEL = None
 
 
-def test_create_multiple_resource_with_model(mock_client):
-    """Test create_multiple method with MODEL."""
-    response_data = [
-        {"id": "id1", "name": "test1", "value": 1},
-        {"id": "id2", "name": "test2", "value": 2},
-    ]
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestCreateableMultipleResource.create_multiple(
-            [{"id": "id1", "name": "test1"}, {"id": "id2", "name": "test2"}]
-        )
-        assert len(result) == 2
-        assert all(isinstance(item, TestModel) for item in result)
-        assert result[0].id == "id1"
-        assert result[1].id == "id2"
-
-
-def test_create_multiple_resource_without_model(mock_client):
-    """Test create_multiple method without MODEL."""
-    response_data = [{"id": "id1"}, {"id": "id2"}]
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestCreateableMultipleResourceNoModel.create_multiple(
-            [{"id": "id1"}, {"id": "id2"}]
-        )
-        assert result == response_data
+@pytest.mark.parametrize(
+    "cls, expected",
+    [
+        (TestCreateableMultipleResource, _TEST_MODELS),
+        (TestCreateableMultipleResourceNoModel, _TEST_MODELS_DICTS),
+    ],
+    ids=["with_model", "without_model"],
+)
+def test_create_multiple_resource(mock_client, cls, expected):
+    """Test create_multiple parses each item with MODEL, or returns the list as is."""
+    mock_client.request.return_value = _TEST_MODELS_DICTS
+    result = cls.create_multiple(
+        [{"id": "id1", "name": "test1"}, {"id": "id2", "name": "test2"}]
+    )
+    assert result == expected
+
+
+def test_create_multiple_resource_sends_serialized_list(mock_client):
+    """Test create_multiple validates and serializes the nodes as one JSON array."""
+    mock_client.request.return_value = []
+    TestCreateableMultipleResource.create_multiple([{"id": "id1"}])
+    call_args = mock_client.request.call_args
+    assert call_args[0] == ("PUT", "v1.0/test-resource/bulk")
+    assert call_args[1]["raw_json"] == b'[{"id":"id1","name":"test","value":0}]'
+
+
+def test_create_multiple_resource_without_response_validation(mock_client):
+    """Test create_multiple returns the raw response when validation is skipped."""
+    response_data = [{"id": "id1", "name": "test1", "value": 1}]
+    mock_client.request.return_value = response_data
+    result = TestCreateableMultipleResource.create_multiple(
+        [{"id": "id1", "name": "test1"}], validate_response=False
+    )
+    assert result is response_data
 
 
 def test_create_multiple_resource_empty_list(mock_client):
@@ -215,43 +283,33 @@ class TestRetrievableResourceNoModel(RetrievableAPIResource):
     MODEL = None
 
 
-def test_retrieve_resource_with_model(mock_client):
-    """Test retrieve method with MODEL."""
+@pytest.mark.parametrize(
+    "cls, model",
+    [(TestRetrievableResource, TestModel), (TestRetrievableResourceNoModel, None)],
+    ids=["with_model", "without_model"],
+)
+def test_retrieve_resource(mock_client, cls, model):
+    """Test retrieve parses the response with MODEL, or returns it as is without one."""
     response_data = {"id": "test-id", "name": "test", "value": 5}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestRetrievableResource.retrieve("test-guid")
-        assert isinstance(result, TestModel)
-        assert result.id == "test-id"
-
-
-def test_retrieve_resource_without_model(mock_client):
-    """Test retrieve method without MODEL."""
-    response_data = {"id": "test-id", "name": "test"}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestRetrievableResourceNoModel.retrieve("test-guid")
-        assert result == response_data
+    mock_client.request.return_value = response_data
+    result = cls.retrieve("test-guid")
+    assert result == (response_data if model is None else model(**response_data))
 
 
 def test_retrieve_resource_with_include_data(mock_client):
     """Test retrieve method with include_data."""
     response_data = {"id": "test-id", "name": "test", "value": 5}
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestRetrievableResource.retrieve("test-guid", include_data=True)
-        call_args = mock_request.call_args[0]
-        assert "incldata" in call_args[1]
+    mock_client.request.return_value = response_data
+    TestRetrievableResource.retrieve("test-guid", include_data=True)
+    assert "incldata" in _url(mock_client.request)
 
 
 def test_retrieve_resource_with_include_subordinates(mock_client):
     """Test retrieve method with include_subordinates."""
     response_data = {"id": "test-id", "name": "test", "value": 5}
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestRetrievableResource.retrieve("test-guid", include_subordinates=True)
-        call_args = mock_request.call_args[0]
-        assert "inclsub" in call_args[1]
+    mock_client.request.return_value = response_data
+    TestRetrievableResource.retrieve("test-guid", include_subordinates=True)
+    assert "inclsub" in _url(mock_client.request)
 
 
 # UpdatableAPIResource tests
@@ -269,22 +327,17 @@ class TestUpdatableResourceNoModel(UpdatableAPIResource):
     MODEL = None
 
 
-def test_update_resource_with_model(mock_client):
-    """Test update method with MODEL."""
+@pytest.mark.parametrize(
+    "cls, model",
+    [(TestUpdatableResource, TestModel), (TestUpdatableResourceNoModel, None)],
+    ids=["with_model", "without_model"],
+)
+def test_update_resource(mock_client, cls, model):
+    """Test update parses the response with MODEL, or returns it as is without one."""
     response_data = {"id": "test-id", "name": "updated", "value": 10}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestUpdatableResource.update("test-guid", name="updated", value=10)
-        assert isinstance(result, TestModel)
-        assert result.name == "updated"
-        assert result.value == 10
-
-
-def test_update_resource_without_model(mock_client):
-    """Test update method without MODEL."""
-    response_data = {"id": "test-id", "name": "updated"}
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestUpdatableResourceNoModel.update("test-guid", name="updated")
-        assert result == response_data
+    mock_client.request.return_value = response_data
+    result = cls.update("test-guid", name="updated", value=10)
+    assert result == (response_data if model is None else model(**response_data))
 
 
 # DeletableAPIResource tests
@@ -296,19 +349,17 @@ class TestDeletableResource(DeletableAPIResource):
 
 def test_delete_resource(mock_client):
     """Test delete method."""
-    with patch.object(mock_client, "request", return_value=None) as mock_request:
-        TestDeletableResource.delete("test-guid")
-        call_args = mock_request.call_args[0]
-        assert call_args[0] == "DELETE"
-        assert "test-guid" in call_args[1]
+    mock_client.request.return_value = None
+    TestDeletableResource.delete("test-guid")
+    assert _method(mock_client.request) == "DELETE"
+    assert "test-guid" in _url(mock_client.request)
 
 
 def test_delete_resource_with_kwargs(mock_client):
     """Test delete method with additional kwargs."""
-    with patch.object(mock_client, "request", return_value=None) as mock_request:
-        TestDeletableResource.delete("test-guid", force=True)
-        call_args = mock_request.call_args[0]
-        assert "force" in call_args[1] or "force" in str(call_args[1])
+    mock_client.request.return_value = None
+    TestDeletableResource.delete("test-guid", force=True)
+    assert "force" in _url(mock_client.request)
 
 
 # AllRetrievableAPIResource tests
@@ -326,46 +377,44 @@ class TestAllRetrievableResourceNoModel(AllRetrievableAPIResource):
     MODEL = None
 
 
-def test_retrieve_all_resource_with_model(mock_client):
-    """Test retrieve_all method with MODEL."""
-    response_data = [
-        {"id": "id1", "name": "test1", "value": 1},
-        {"id": "id2", "name": "test2", "value": 2},
-    ]
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestAllRetrievableResource.retrieve_all()
-        assert len(result) == 2
-        assert all(isinstance(item, TestModel) for item in result)
-
-
-def test_retrieve_all_resource_without_model(mock_client):
-    """Test retrieve_all method without MODEL."""
-    response_data = [{"id": "id1"}, {"id": "id2"}]
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestAllRetrievableResourceNoModel.retrieve_all()
-        assert result == response_data
+@pytest.mark.parametrize(
+    "cls, expected",
+    [
+        (TestAllRetrievableResource, _TEST_MODELS),
+        (TestAllRetrievableResourceNoModel, _TEST_MODELS_DICTS),
+    ],
+    ids=["with_model", "without_model"],
+)
+def test_retrieve_all_resource(mock_client, cls, expected):
+    """Test retrieve_all parses each item with MODEL, or returns the list as is."""
+    mock_client.request.return_value = _TEST_MODELS_DICTS
+    result = cls.retrieve_all()
+    assert result == expected
 
 
 def test_retrieve_all_resource_with_include_data(mock_client):
     """Test retrieve_all method with include_data."""
     response_data = [{"id": "id1"}]
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestAllRetrievableResource.retrieve_all(include_data=True)
-        call_args = mock_request.call_args[0]
-        assert "incldata" in call_args[1]
+    mock_client.request.return_value = response_data
+    TestAllRetrievableResource.retrieve_all(include_data=True)
+    assert "incldata" in _url(mock_client.request)
+
+
+def test_retrieve_all_resource_with_both_includes(mock_client):
+    """Test retrieve_all builds both include flags in a stable order."""
+    mock_client.request.return_value = []
+    TestAllRetrievableResource.retrieve_all(
+        include_subordinates=True, include_data=True
+    )
+    assert _url(mock_client.request) == "v1.0/test-resource?incldata&inclsub"
 
 
 def test_retrieve_all_resource_with_include_subordinates(mock_client):
     """Test retrieve_all method with include_subordinates."""
     response_data = [{"id": "id1"}]
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestAllRetrievableResource.retrieve_all(include_subordinates=True)
-        call_args = mock_request.call_args[0]
-        assert "inclsub" in call_args[1]
+    mock_client.request.return_value = response_data
+    TestAllRetrievableResource.retrieve_all(include_subordinates=True)
+    assert "inclsub" in _url(mock_client.request)
 
 
 # SearchableAPIResource tests
@@ -378,68 +427,25 @@ class TestSearchableResource(SearchableAPIResource):
 
 def test_search_resource(mock_client):
     """Test search method."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestSearchableResource.search(query="test")
-        assert isinstance(result, EnumerationResultModel)
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    result = TestSearchableResource.search(query="test")
+    assert isinstance(result, EnumerationResultModel)
 
 
 def test_search_resource_with_include_data(mock_client):
     """Test search method with include_data."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestSearchableResource.search(include_data=True)
-        call_kwargs = mock_request.call_args[1]
-        assert "data" in call_kwargs
-        data_str = (
-            call_kwargs["data"].decode()
-            if isinstance(call_kwargs["data"], bytes)
-            else call_kwargs["data"]
-        )
-        assert "IncludeData" in data_str or "include_data" in data_str.lower()
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    TestSearchableResource.search(include_data=True)
+    call_kwargs = mock_client.request.call_args[1]
+    assert b'"IncludeData":true' in call_kwargs["raw_json"]
 
 
 def test_search_resource_with_include_subordinates(mock_client):
     """Test search method with include_subordinates."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestSearchableResource.search(include_subordinates=True)
-        call_kwargs = mock_request.call_args[1]
-        assert "data" in call_kwargs
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    TestSearchableResource.search(include_subordinates=True)
+    call_kwargs = mock_client.request.call_args[1]
+    assert b'"IncludeSubordinates":true' in call_kwargs["raw_json"]
 
 
 # EnumerableAPIResource tests
@@ -457,82 +463,44 @@ class TestEnumerableResourceNoModel(EnumerableAPIResource):
     MODEL = None
 
 
-def test_enumerate_resource_with_model(mock_client):
-    """Test enumerate method with MODEL."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestEnumerableResource.enumerate()
+@pytest.mark.parametrize(
+    "cls, model",
+    [(TestEnumerableResource, TestModel), (TestEnumerableResourceNoModel, None)],
+    ids=["with_model", "without_model"],
+)
+def test_enumerate_resource(mock_client, cls, model):
+    """Test enumerate parses an EnumerationResultModel with MODEL, else returns raw."""
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    result = cls.enumerate()
+    if model is None:
+        assert result == _EMPTY_ENUM_RESPONSE
+    else:
         assert isinstance(result, EnumerationResultModel)
 
 
-def test_enumerate_resource_without_model(mock_client):
-    """Test enumerate method without MODEL."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestEnumerableResourceNoModel.enumerate()
-        assert result == response_data
-
-
 def test_enumerate_resource_with_include_data(mock_client):
     """Test enumerate method with include_data."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestEnumerableResource.enumerate(include_data=True)
-        call_args = mock_request.call_args[0]
-        assert "incldata" in call_args[1]
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    TestEnumerableResource.enumerate(include_data=True)
+    assert "incldata" in _url(mock_client.request)
+
+
+def test_enumerate_resource_with_both_includes(mock_client):
+    """Test enumerate appends include flags after the other query parameters."""
+    mock_client.request.return_value = {"Objects": []}
+    TestEnumerableResource.enumerate(
+        include_data=True, include_subordinates=True, max_results=5
+    )
+    assert (
+        _url(mock_client.request) == "v2.0/test-resource?max_results=5&incldata&inclsub"
+    )
 
 
 def test_enumerate_resource_with_include_subordinates(mock_client):
     """Test enumerate method with include_subordinates."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestEnumerableResource.enumerate(include_subordinates=True)
-        call_args = mock_request.call_args[0]
-        assert "inclsub" in call_args[1]
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    TestEnumerableResource.enumerate(include_subordinates=True)
+    assert "inclsub" in _url(mock_client.request)
 
 
 # EnumerableAPIResourceWithData tests
@@ -550,103 +518,105 @@ class TestEnumerableResourceWithDataNoModel(EnumerableAPIResourceWithData):
     MODEL = None
 
 
-def test_enumerate_with_query_resource_with_model(mock_client):
-    """Test enumerate_with_query method with MODEL."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestEnumerableResourceWithData.enumerate_with_query(max_results=10)
+@pytest.mark.parametrize(
+    "cls, model",
+    [
+        (TestEnumerableResourceWithData, TestModel),
+        (TestEnumerableResourceWithDataNoModel, None),
+    ],
+    ids=["with_model", "without_model"],
+)
+def test_enumerate_with_query_resource(mock_client, cls, model):
+    """Test enumerate_with_query parses the result with MODEL, else returns raw."""
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    result = cls.enumerate_with_query(max_results=10)
+    if model is None:
+        assert result == _EMPTY_ENUM_RESPONSE
+    else:
         assert isinstance(result, EnumerationResultModel)
 
 
-def test_enumerate_with_query_resource_without_model(mock_client):
-    """Test enumerate_with_query method without MODEL."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestEnumerableResourceWithDataNoModel.enumerate_with_query(
-            max_results=10
-        )
-        assert result == response_data
-
-
 def test_enumerate_with_query_resource_with_data_param(mock_client):
     """Test enumerate_with_query method with _data parameter."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(mock_client, "request", return_value=response_data):
-        result = TestEnumerableResourceWithData.enumerate_with_query(
-            _data={"max_results": 10}
-        )
-        assert isinstance(result, EnumerationResultModel)
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    result = TestEnumerableResourceWithData.enumerate_with_query(
+        _data={"max_results": 10}
+    )
+    assert isinstance(result, EnumerationResultModel)
+
+
+def test_enumerate_with_query_resource_kwargs_body(mock_client):
+    """Test query kwargs are used for both the URL and the request body."""
+    mock_client.request.return_value = {"Objects": []}
+    TestEnumerableResourceWithData.enumerate_with_query(
+        max_results=10, include_data=True
+    )
+    url = _url(mock_client.request)
+    raw_json = mock_client.request.call_args[1]["raw_json"]
+    assert "max_results=10" in url
+    assert "include_data=True" in url
+    assert b'"MaxResults":10' in raw_json
+    assert b'"IncludeData":true' in raw_json
 
 
 def test_enumerate_with_query_resource_with_include_data(mock_client):
     """Test enumerate_with_query method with include_data."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestEnumerableResourceWithData.enumerate_with_query(include_data=True)
-        call_kwargs = mock_request.call_args[1]
-        assert "json" in call_kwargs
-        assert "IncludeData" in str(call_kwargs["json"])
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    TestEnumerableResourceWithData.enumerate_with_query(include_data=True)
+    call_kwargs = mock_client.request.call_args[1]
+    assert b'"IncludeData":true' in call_kwargs["raw_json"]
 
 
 def test_enumerate_with_query_resource_with_include_subordinates(mock_client):
     """Test enumerate_with_query method with include_subordinates."""
-    response_data = {
-        "Success": True,
-        "Timestamp": {"Timestamp": "2024-01-01T00:00:00Z"},
-        "MaxResults": 1000,
-        "IterationsRequired": 0,
-        "ContinuationToken": None,
-        "EndOfResults": True,
-        "TotalRecords": 0,
-        "RecordsRemaining": 0,
-        "Objects": [],
-    }
-    with patch.object(
-        mock_client, "request", return_value=response_data
-    ) as mock_request:
-        TestEnumerableResourceWithData.enumerate_with_query(include_subordinates=True)
-        call_kwargs = mock_request.call_args[1]
-        assert "json" in call_kwargs
-        assert "IncludeSubordinates" in str(call_kwargs["json"])
+    mock_client.request.return_value = _EMPTY_ENUM_RESPONSE
+    TestEnumerableResourceWithData.enumerate_with_query(include_subordinates=True)
+    call_kwargs = mock_client.request.call_args[1]
+    assert b'"IncludeSubordinates":true' in call_kwargs["raw_json"]
+
+
+# Async mixin tests
+@pytest.fixture(scope="module")
+def mock_async_client():
+    """Create a mock async client shared by the module."""
+    client = Mock(spec_set=AsyncBaseClient)
+    client.request = AsyncMock()
+    with patch("sharpai_sdk.mixins.aget_client", return_value=client):
+        yield client
+
+
+def test_acreate_resource_with_model(mock_async_client):
+    """Test acreate method with MODEL."""
+    mock_async_client.request.return_value = {"id": "new-id", "name": "created"}
+    result = asyncio.run(TestCreateableResource.acreate(id="new-id", name="created"))
+    assert isinstance(result, TestModel)
+    assert mock_async_client.request.call_args[0] == ("PUT", "v1.0/test-resource")
+
+
+def test_aretrieve_resource_with_model(mock_async_client):
+    """Test aretrieve method with MODEL."""
+    mock_async_client.request.return_value = {"id": "test-id"}
+    result = asyncio.run(
+        TestRetrievableResource.aretrieve("test-guid", include_data=True)
+    )
+    assert isinstance(result, TestModel)
+    assert "incldata" in _url(mock_async_client.request)
+
+
+def test_aenumerate_resource_with_model(mock_async_client):
+    """Test aenumerate method with MODEL."""
+    mock_async_client.request.return_value = {"Objects": [{"id": "id1"}]}
+    result = asyncio.run(TestEnumerableResource.aenumerate())
+    assert isinstance(result, EnumerationResultModel)
+    assert result.objects[0].id == "id1"
+
+
+def test_enumeration_result_model_is_cached():
+    """Test the EnumerationResultModel parameterization is built once per model."""
+    from sharpai_sdk.mixins import _enumeration_result_model
+
+    result_model = _enumeration_result_model(TestModel)
+    assert result_model is _enumeration_result_model(TestModel)
+    assert result_model.model_validate({"Objects": [{"id": "id1"}]}).objects[0].id == (
+        "id1"
+    )
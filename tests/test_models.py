@@ -1,3 +1,5 @@
+import pytest
+
 from sharpai_sdk.models.ollama_models import (
     ChatMessage,
     ChatRequest,
@@ -5,6 +7,7 @@ from sharpai_sdk.models.ollama_models import (
     DeleteRequest,
     EmbedRequest,
     EmbedResponse,
+    GenerateOptions,
     GenerateRequest,
     GenerateResponse,
     PullRequest,
@@ -19,176 +22,163 @@ from sharpai_sdk.models.openai_models import (
     OpenAIEmbeddingResponse,
 )
 
-
-def test_tags_response():
-    """Test TagsResponse model."""
-    data = {
-        "models": [
-            {"name": "model1", "size": 1000},
-            {"name": "model2", "size": 2000},
-        ]
-    }
-    response = TagsResponse(**data)
-    assert len(response.models) == 2
-    assert response.models[0].name == "model1"
-
-
-def test_pull_request():
-    """Test PullRequest model."""
-    request = PullRequest(model="test-model")
-    assert request.model == "test-model"
-    data = request.model_dump()
-    assert data["model"] == "test-model"
-
-
-def test_delete_request():
-    """Test DeleteRequest model."""
-    request = DeleteRequest(name="test-model")
-    assert request.name == "test-model"
-
-
-def test_embed_request_singular():
-    """Test EmbedRequest with singular input."""
-    request = EmbedRequest(model="test-model", input="test text")
-    assert request.model == "test-model"
-    assert request.input == "test text"
-
-
-def test_embed_request_multiple():
-    """Test EmbedRequest with multiple inputs."""
-    request = EmbedRequest(model="test-model", input=["text1", "text2"])
-    assert request.input == ["text1", "text2"]
-
-
-def test_embed_response():
-    """Test EmbedResponse model."""
-    # Test with singular embedding
-    data = {"embedding": [0.1, 0.2, 0.3]}
-    response = EmbedResponse(**data)
-    assert response.embedding == [0.1, 0.2, 0.3]
-
-    # Test with multiple embeddings
-    data = {
-        "embeddings": [
-            {"embedding": [0.1, 0.2], "index": 0},
-            {"embedding": [0.3, 0.4], "index": 1},
-        ]
-    }
-    response = EmbedResponse(**data)
-    assert len(response.embeddings) == 2
-
-
-def test_generate_request():
-    """Test GenerateRequest model."""
-    request = GenerateRequest(model="test-model", prompt="test prompt", stream=False)
-    assert request.model == "test-model"
-    assert request.prompt == "test prompt"
-    assert request.stream is False
-
-
-def test_generate_response():
-    """Test GenerateResponse model."""
-    data = {
-        "model": "test-model",
-        "response": "test response",
-        "done": True,
-    }
-    response = GenerateResponse(**data)
-    assert response.model == "test-model"
-    assert response.response == "test response"
-    assert response.done is True
-
-
-def test_chat_message():
-    """Test ChatMessage model."""
-    message = ChatMessage(role="user", content="Hello")
-    assert message.role == "user"
-    assert message.content == "Hello"
-
-
-def test_chat_request():
-    """Test ChatRequest model."""
-    messages = [{"role": "user", "content": "Hello"}]
-    request = ChatRequest(model="test-model", messages=messages, stream=False)
-    assert request.model == "test-model"
-    assert len(request.messages) == 1
-
-
-def test_chat_response():
-    """Test ChatResponse model."""
-    data = {
-        "model": "test-model",
-        "message": {"role": "assistant", "content": "Hi"},
-        "done": True,
-    }
-    response = ChatResponse(**data)
-    assert response.model == "test-model"
-    assert response.message.content == "Hi"
-
-
-def test_openai_embedding_request():
-    """Test OpenAIEmbeddingRequest model."""
-    request = OpenAIEmbeddingRequest(model="test-model", input="test")
-    assert request.model == "test-model"
-    assert request.input == "test"
-
-
-def test_openai_embedding_response():
-    """Test OpenAIEmbeddingResponse model."""
-    data = {
-        "object": "list",
-        "data": [{"object": "embedding", "embedding": [0.1, 0.2], "index": 0}],
-        "model": "test-model",
-    }
-    response = OpenAIEmbeddingResponse(**data)
-    assert len(response.data) == 1
-    assert response.data[0].embedding == [0.1, 0.2]
-
-
-def test_openai_completion_request():
-    """Test OpenAICompletionRequest model."""
-    request = OpenAICompletionRequest(model="test-model", prompt="test", max_tokens=100)
-    assert request.model == "test-model"
-    assert request.prompt == "test"
-    assert request.max_tokens == 100
-
-
-def test_openai_completion_response():
-    """Test OpenAICompletionResponse model."""
-    data = {
-        "id": "test-id",
-        "object": "text_completion",
-        "created": 1234567890,
-        "model": "test-model",
-        "choices": [{"text": "test", "index": 0}],
-    }
-    response = OpenAICompletionResponse(**data)
-    assert len(response.choices) == 1
-    assert response.choices[0].text == "test"
-
-
-def test_openai_chat_completion_request():
-    """Test OpenAIChatCompletionRequest model."""
-    messages = [{"role": "user", "content": "Hello"}]
-    request = OpenAIChatCompletionRequest(model="test-model", messages=messages)
-    assert request.model == "test-model"
-    assert len(request.messages) == 1
-
-
-def test_openai_chat_completion_response():
-    """Test OpenAIChatCompletionResponse model."""
-    data = {
-        "id": "test-id",
-        "object": "chat.completion",
-        "created": 1234567890,
-        "model": "test-model",
-        "choices": [
-            {
-                "index": 0,
-                "message": {"role": "assistant", "content": "Hi"},
-            }
-        ],
-    }
-    response = OpenAIChatCompletionResponse(**data)
-    assert len(response.choices) == 1
-    assert response.choices[0].message.content == "Hi"
+# Payloads shared by the model tests; never mutated.
+_MESSAGES = [{"role": "user", "content": "Hello"}]
+_TAGS_RESPONSE_DATA = {
+    "models": [
+        {"name": "model1", "size": 1000},
+        {"name": "model2", "size": 2000},
+    ]
+}
+_GENERATE_RESPONSE_DATA = {
+    "model": "test-model",
+    "response": "test response",
+    "done": True,
+}
+_CHAT_RESPONSE_DATA = {
+    "model": "test-model",
+    "message": {"role": "assistant", "content": "Hi"},
+    "done": True,
+}
+_OPENAI_EMBEDDING_RESPONSE_DATA = {
+    "object": "list",
+    "data": [{"object": "embedding", "embedding": [0.1, 0.2], "index": 0}],
+    "model": "test-model",
+}
+_OPENAI_COMPLETION_RESPONSE_DATA = {
+    "id": "test-id",
+    "object": "text_completion",
+    "created": 1234567890,
+    "model": "test-model",
+    "choices": [{"text": "test", "index": 0}],
+}
+_OPENAI_CHAT_COMPLETION_RESPONSE_DATA = {
+    "id": "test-id",
+    "object": "chat.completion",
+    "created": 1234567890,
+    "model": "test-model",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hi"},
+        }
+    ],
+}
+
+
+def _resolve(obj, path):
+    """Follow a dotted attribute path, treating numeric parts as list indexes."""
+    for part in path.split("."):
+        obj = obj[int(part)] if part.isdigit() else getattr(obj, part)
+    return obj
+
+
+# (model class, payload, attribute path, expected value at that path)
+_ROUNDTRIPS = [
+    (TagsResponse, _TAGS_RESPONSE_DATA, "models.1.name", "model2"),
+    (PullRequest, {"model": "test-model"}, "model", "test-model"),
+    (DeleteRequest, {"name": "test-model"}, "name", "test-model"),
+    (
+        EmbedRequest,
+        {"model": "test-model", "input": "test text"},
+        "input",
+        "test text",
+    ),
+    (
+        EmbedRequest,
+        {"model": "test-model", "input": ["text1", "text2"]},
+        "input.1",
+        "text2",
+    ),
+    (
+        EmbedResponse,
+        {"embedding": [0.1, 0.2, 0.3]},
+        "embedding",
+        [0.1, 0.2, 0.3],
+    ),
+    (
+        EmbedResponse,
+        {
+            "embeddings": [
+                {"embedding": [0.1, 0.2], "index": 0},
+                {"embedding": [0.3, 0.4], "index": 1},
+            ]
+        },
+        "embeddings.1.embedding",
+        [0.3, 0.4],
+    ),
+    (
+        GenerateRequest,
+        {"model": "test-model", "prompt": "test prompt", "stream": False},
+        "prompt",
+        "test prompt",
+    ),
+    (GenerateResponse, _GENERATE_RESPONSE_DATA, "response", "test response"),
+    (ChatMessage, {"role": "user", "content": "Hello"}, "content", "Hello"),
+    (
+        ChatRequest,
+        {"model": "test-model", "messages": _MESSAGES, "stream": False},
+        "messages.0.content",
+        "Hello",
+    ),
+    (ChatResponse, _CHAT_RESPONSE_DATA, "message.content", "Hi"),
+    (
+        OpenAIEmbeddingRequest,
+        {"model": "test-model", "input": "test"},
+        "input",
+        "test",
+    ),
+    (
+        OpenAIEmbeddingResponse,
+        _OPENAI_EMBEDDING_RESPONSE_DATA,
+        "data.0.embedding",
+        [0.1, 0.2],
+    ),
+    (
+        OpenAICompletionRequest,
+        {"model": "test-model", "prompt": "test", "max_tokens": 100},
+        "max_tokens",
+        100,
+    ),
+    (
+        OpenAICompletionResponse,
+        _OPENAI_COMPLETION_RESPONSE_DATA,
+        "choices.0.text",
+        "test",
+    ),
+    (
+        OpenAIChatCompletionRequest,
+        {"model": "test-model", "messages": _MESSAGES},
+        "messages.0.role",
+        "user",
+    ),
+    (
+        OpenAIChatCompletionResponse,
+        _OPENAI_CHAT_COMPLETION_RESPONSE_DATA,
+        "choices.0.message.content",
+        "Hi",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "cls, data, path, expected",
+    _ROUNDTRIPS,
+    ids=[f"{case[0].__name__}-{case[2]}" for case in _ROUNDTRIPS],
+)
+def test_model_roundtrip(cls, data, path, expected):
+    """Test each model parses its payload and dumps it back unchanged."""
+    model = cls(**data)
+    assert _resolve(model, path) == expected
+    assert model.model_dump(exclude_unset=True) == data
+
+
+def test_generate_request_options_pass_through():
+    """Test options are kept as given, including keys GenerateOptions does not list."""
+    options = GenerateOptions(temperature=0.5, num_ctx=2048)
+    assert options == {"temperature": 0.5, "num_ctx": 2048}
+
+    request = GenerateRequest(
+        model="test-model", prompt="p", options={**options, "custom": True}
+    )
+    assert request.options == {"temperature": 0.5, "num_ctx": 2048, "custom": True}
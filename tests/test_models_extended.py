@@ -2,6 +2,8 @@
 
 from datetime import datetime, timezone
 
+import pytest
+from pydantic import ValidationError
 
 from sharpai_sdk.enums.enumeration_order_enum import EnumerationOrder_Enum
 from sharpai_sdk.models.enumeration_query import EnumerationQueryModel
@@ -9,6 +11,10 @@ from sharpai_sdk.models.enumeration_result import EnumerationResultModel
 from sharpai_sdk.models.expression import ExprModel
 from sharpai_sdk.models.timestamp import TimestampModel
 
+# Sample enumeration values shared by the tests; never mutated.
+_CUSTOM_OBJECTS = ({"id": 1}, {"id": 2})
+_CUSTOM_TIMESTAMP = TimestampModel()
+
 
 def test_timestamp_model():
     """Test TimestampModel."""
@@ -84,27 +90,26 @@ def test_enumeration_result_model():
     assert result.objects == []
 
     # Test with custom values
-    custom_timestamp = TimestampModel()
     result = EnumerationResultModel(
         success=False,
-        timestamp=custom_timestamp,
+        timestamp=_CUSTOM_TIMESTAMP,
         max_results=100,
         iterations_required=5,
         continuation_token="token123",
         end_of_results=False,
         total_records=50,
         records_remaining=25,
-        objects=[{"id": 1}, {"id": 2}],
+        objects=_CUSTOM_OBJECTS,
     )
     assert result.success is False
-    assert result.timestamp == custom_timestamp
+    assert result.timestamp == _CUSTOM_TIMESTAMP
     assert result.max_results == 100
     assert result.iterations_required == 5
     assert result.continuation_token == "token123"
     assert result.end_of_results is False
     assert result.total_records == 50
     assert result.records_remaining == 25
-    assert result.objects == [{"id": 1}, {"id": 2}]
+    assert result.objects == list(_CUSTOM_OBJECTS)
 
     # Test with aliases
     result = EnumerationResultModel(
@@ -133,3 +138,14 @@ def test_enumeration_result_model():
     assert len(result.objects) == 2
     assert result.objects[0].value == 1
     assert result.objects[1].value == 2
+
+
+def test_expr_model_is_frozen():
+    """Test ExprModel is immutable, hashable and rejects unknown fields."""
+    expr = ExprModel(Left="name", Right="value")
+    assert hash(expr) == hash(ExprModel(Left="name", Right="value"))
+
+    with pytest.raises(ValidationError):
+        expr.Left = "other"
+    with pytest.raises(ValidationError):
+        ExprModel(Left="name", Unknown="value")
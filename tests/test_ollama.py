@@ -1,20 +1,48 @@
-from unittest.mock import Mock, patch
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from sharpai_sdk.configuration import configure
+from sharpai_sdk.async_base import AsyncBaseClient
+from sharpai_sdk.base import BaseClient
+from sharpai_sdk.cache import InMemoryEmbeddingCache
+from sharpai_sdk.models.ollama_models import (
+    ChatMessage,
+    ChatResponse,
+    EmbedResponse,
+    GenerateResponse,
+)
+from sharpai_sdk.resources import ollama as _ollama_mod
 from sharpai_sdk.resources.ollama import Ollama
+from sharpai_sdk.utils.json_helper import _json_dumps
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
-    """Create a mock client for testing."""
-    configure(endpoint="http://localhost:8000")
-    client = Mock()
-    with patch("sharpai_sdk.resources.ollama.get_client", return_value=client):
+    """Create a mock client shared by the module."""
+    client = Mock(spec_set=BaseClient)
+    with patch.object(_ollama_mod, "get_client", return_value=client):
         yield client
 
 
+@pytest.fixture(scope="module")
+def mock_async_client():
+    """Create a mock async client shared by the module."""
+    client = Mock(spec_set=AsyncBaseClient)
+    client.request = AsyncMock()
+    with patch.object(_ollama_mod, "aget_client", return_value=client):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_client, mock_async_client):
+    """Reset the shared mock clients after each test."""
+    yield
+    mock_client.request.reset_mock(return_value=True, side_effect=True)
+    mock_async_client.request.reset_mock(return_value=True, side_effect=True)
+
+
 def test_list_models(mock_client):
     """Test listing models."""
     mock_response = {
@@ -31,100 +59,310 @@ def test_list_models(mock_client):
     mock_client.request.assert_called_once_with("GET", "api/tags")
 
 
-def test_pull_model(mock_client):
-    """Test pulling a model."""
-    mock_response = {"status": "pulling"}
-    mock_client.request.return_value = mock_response
+def test_list_models_fast(mock_client):
+    """Test listing models decodes the raw body with msgspec."""
+    pytest.importorskip("msgspec")
+    mock_client.request.return_value = (
+        b'{"models": [{"name": "llama3", "size": 42, "details": {"family": "llama"}}]}'
+    )
 
-    result = Ollama.pull_model("test-model")
-    assert result == mock_response
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "api/pull"
-    assert call_args[1]["json"]["model"] == "test-model"
+    result = Ollama.list_models_fast()
+    assert result.models[0].name == "llama3"
+    assert result.models[0].size == 42
+    assert result.models[0].details == {"family": "llama"}
+    mock_client.request.assert_called_once_with("GET", "api/tags", decode=False)
 
 
-def test_delete_model(mock_client):
-    """Test deleting a model."""
-    mock_response = {"status": "deleted"}
-    mock_client.request.return_value = mock_response
+_EMBEDDINGS_RESPONSE = {
+    "embeddings": [
+        {"embedding": [0.1, 0.2], "index": 0},
+        {"embedding": [0.3, 0.4], "index": 1},
+    ]
+}
+_GENERATE_RESPONSE = {
+    "model": "test-model",
+    "response": "This is a test response",
+    "done": True,
+}
+_CHAT_RESPONSE = {
+    "model": "test-model",
+    "message": {"role": "assistant", "content": "Hello!"},
+    "done": True,
+}
+_MESSAGES = [{"role": "user", "content": "Hello"}]
 
-    result = Ollama.delete_model("test-model")
-    assert result == mock_response
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "DELETE"
-    assert call_args[0][1] == "api/delete"
-    assert call_args[1]["json"]["name"] == "test-model"
 
+@pytest.mark.parametrize(
+    "name, args, response, expected, verb, path, sent",
+    [
+        pytest.param(
+            "pull_model",
+            ("test-model",),
+            {"status": "pulling"},
+            {"status": "pulling"},
+            "POST",
+            "api/pull",
+            {"raw_json": _json_dumps({"model": "test-model"})},
+            id="pull_model",
+        ),
+        pytest.param(
+            "delete_model",
+            ("test-model",),
+            {"status": "deleted"},
+            {"status": "deleted"},
+            "DELETE",
+            "api/delete",
+            {"raw_json": _json_dumps({"name": "test-model"})},
+            id="delete_model",
+        ),
+        pytest.param(
+            "generate_embedding",
+            ("test-model", "test input"),
+            {"embedding": [0.1, 0.2, 0.3]},
+            EmbedResponse(
+                embedding=[0.1, 0.2, 0.3],
+                embeddings=[{"embedding": [0.1, 0.2, 0.3], "index": 0}],
+            ),
+            "POST",
+            "api/embed",
+            {"json": {"model": "test-model", "input": "test input"}},
+            id="generate_embedding_singular",
+        ),
+        pytest.param(
+            "generate_embedding",
+            ("test-model", ["input1", "input2"]),
+            _EMBEDDINGS_RESPONSE,
+            EmbedResponse(**_EMBEDDINGS_RESPONSE),
+            "POST",
+            "api/embed",
+            {"json": {"model": "test-model", "input": ["input1", "input2"]}},
+            id="generate_embedding_multiple",
+        ),
+        pytest.param(
+            "generate",
+            ("test-model", "test prompt", False),
+            _GENERATE_RESPONSE,
+            GenerateResponse(**_GENERATE_RESPONSE),
+            "POST",
+            "api/generate",
+            {"json": {"model": "test-model", "prompt": "test prompt", "stream": False}},
+            id="generate",
+        ),
+        pytest.param(
+            "chat",
+            ("test-model", _MESSAGES, False),
+            _CHAT_RESPONSE,
+            ChatResponse(**_CHAT_RESPONSE),
+            "POST",
+            "api/chat",
+            {"json": {"model": "test-model", "messages": _MESSAGES, "stream": False}},
+            id="chat",
+        ),
+    ],
+)
+def test_ollama_dispatch(mock_client, name, args, response, expected, verb, path, sent):
+    """Test each method sends the expected request and parses the response."""
+    mock_client.request.return_value = response
 
-def test_generate_embedding_singular(mock_client):
-    """Test generating embedding for single input."""
-    mock_response = {"embedding": [0.1, 0.2, 0.3, 0.4, 0.5]}
-    mock_client.request.return_value = mock_response
+    result = getattr(Ollama, name)(*args)
+    assert result == expected
+    mock_client.request.assert_called_once_with(verb, path, **sent)
 
-    result = Ollama.generate_embedding("test-model", "test input")
-    assert result.embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "api/embed"
-    assert call_args[1]["json"]["model"] == "test-model"
-    assert call_args[1]["json"]["input"] == "test input"
 
+def test_chat_message_passthrough(mock_client):
+    """Test dict messages are sent unchanged and ChatMessage objects are dumped."""
+    mock_client.request.return_value = {"done": True}
 
-def test_generate_embedding_multiple(mock_client):
-    """Test generating embeddings for multiple inputs."""
-    mock_response = {
+    messages = [
+        {"role": "user", "content": "Describe", "images": ["aGVsbG8="]},
+        ChatMessage.model_construct(role="assistant", content="Sure"),
+    ]
+    Ollama.chat("test-model", messages)
+    sent = mock_client.request.call_args[1]["json"]["messages"]
+    assert sent[0] is messages[0]
+    assert sent[1] == {"role": "assistant", "content": "Sure"}
+
+
+def test_agenerate_embedding(mock_async_client):
+    """Test generating an embedding asynchronously."""
+    mock_async_client.request.return_value = {"embedding": [0.1, 0.2]}
+
+    result = asyncio.run(Ollama.agenerate_embedding("test-model", "test input"))
+    assert result.embedding == [0.1, 0.2]
+    mock_async_client.request.assert_awaited_once_with(
+        "POST", "api/embed", json={"model": "test-model", "input": "test input"}
+    )
+
+
+def test_async_methods_run_concurrently(mock_async_client):
+    """Test independent async calls can be gathered."""
+    mock_async_client.request.side_effect = [
+        {"models": [{"name": "model1"}]},
+        {"model": "test-model", "response": "Hi", "done": True},
+    ]
+
+    async def run():
+        return await asyncio.gather(
+            Ollama.alist_models(), Ollama.agenerate("test-model", "test prompt")
+        )
+
+    tags, generated = asyncio.run(run())
+    assert tags.models[0].name == "model1"
+    assert generated.response == "Hi"
+    assert mock_async_client.request.await_count == 2
+
+
+def test_generate_stream(mock_client):
+    """Test streaming a completion yields parsed NDJSON chunks."""
+    lines = [
+        '{"model": "test-model", "response": "Hel", "done": false}',
+        "",
+        '{"model": "test-model", "response": "lo", "done": true}',
+    ]
+    response = Mock()
+    response.iter_lines.return_value = iter(lines)
+
+    @contextmanager
+    def stream(method, url, **kwargs):
+        assert (method, url) == ("POST", "api/generate")
+        assert kwargs["json"]["stream"] is True
+        yield response
+
+    with patch.object(mock_client, "stream", stream):
+        chunks = list(Ollama.generate("test-model", "test prompt", stream=True))
+    assert [chunk.response for chunk in chunks] == ["Hel", "lo"]
+    assert chunks[-1].done is True
+    mock_client.request.assert_not_called()
+
+
+def test_achat_stream(mock_async_client):
+    """Test streaming a chat completion asynchronously."""
+    lines = ['{"message": {"role": "assistant", "content": "Hi"}, "done": true}']
+
+    async def aiter_lines():
+        for line in lines:
+            yield line
+
+    response = Mock()
+    response.aiter_lines = aiter_lines
+
+    @asynccontextmanager
+    async def stream(method, url, **kwargs):
+        assert (method, url) == ("POST", "api/chat")
+        yield response
+
+    async def run():
+        chunks = await Ollama.achat("test-model", _MESSAGES, stream=True)
+        return [chunk async for chunk in chunks]
+
+    with patch.object(mock_async_client, "stream", stream):
+        chunks = asyncio.run(run())
+    assert chunks[0].message.content == "Hi"
+
+
+def test_generate_embedding_uses_cache(mock_client):
+    """Test cached inputs are not sent to the server again."""
+    cache = InMemoryEmbeddingCache()
+    cache.set("test-model", "cached", [9.0])
+    mock_client.request.return_value = {
         "embeddings": [
-            {"embedding": [0.1, 0.2], "index": 0},
-            {"embedding": [0.3, 0.4], "index": 1},
+            {"embedding": [1.0], "index": 0},
+            {"embedding": [3.0], "index": 1},
         ]
     }
-    mock_client.request.return_value = mock_response
 
-    result = Ollama.generate_embedding("test-model", ["input1", "input2"])
-    assert len(result.embeddings) == 2
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[1]["json"]["input"] == ["input1", "input2"]
+    with patch("sharpai_sdk.resources.ollama.get_embedding_cache", return_value=cache):
+        result = Ollama.generate_embedding("test-model", ["a", "cached", "c"])
+        assert [e.embedding for e in result.embeddings] == [[1.0], [9.0], [3.0]]
+        assert mock_client.request.call_args[1]["json"]["input"] == ["a", "c"]
 
+        mock_client.request.reset_mock()
+        single = Ollama.generate_embedding("test-model", "a")
+        assert single.embedding == [1.0]
+        mock_client.request.assert_not_called()
 
-def test_generate(mock_client):
-    """Test generating a completion."""
-    mock_response = {
-        "model": "test-model",
-        "response": "This is a test response",
-        "done": True,
+
+@pytest.mark.parametrize(
+    "input_data, response",
+    [
+        ("hi", {"embedding": [0.1, 0.2]}),
+        ("hi", {"embeddings": [{"embedding": [0.1, 0.2], "index": 0}]}),
+        (["a", "b"], _EMBEDDINGS_RESPONSE),
+    ],
+)
+def test_generate_embedding_same_shape_with_cache(mock_client, input_data, response):
+    """Test configuring a cache does not change the returned response."""
+    mock_client.request.return_value = response
+    uncached = Ollama.generate_embedding("test-model", input_data)
+
+    cache = InMemoryEmbeddingCache()
+    with patch("sharpai_sdk.resources.ollama.get_embedding_cache", return_value=cache):
+        fetched = Ollama.generate_embedding("test-model", input_data)
+        cached = Ollama.generate_embedding("test-model", input_data)
+
+    assert fetched == uncached
+    assert cached == uncached
+    assert mock_client.request.call_count == 2
+
+
+def test_generate_embedding_single_request_for_list(mock_client):
+    """Test a list within batch_size is sent as one request."""
+    mock_client.request.return_value = {
+        "embeddings": [{"embedding": [0.1], "index": 0}, {"embedding": [0.2]}]
     }
-    mock_client.request.return_value = mock_response
 
-    result = Ollama.generate("test-model", "test prompt", stream=False)
-    assert result.response == "This is a test response"
+    Ollama.generate_embedding("test-model", ["a", "b"])
     mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "api/generate"
-    assert call_args[1]["json"]["model"] == "test-model"
-    assert call_args[1]["json"]["prompt"] == "test prompt"
+    assert mock_client.request.call_args[1]["json"]["input"] == ["a", "b"]
 
 
-def test_chat(mock_client):
-    """Test generating a chat completion."""
-    mock_response = {
-        "model": "test-model",
-        "message": {"role": "assistant", "content": "Hello!"},
-        "done": True,
+def test_generate_embedding_batches_large_input(mock_client):
+    """Test oversized lists are split into batches and reassembled in order."""
+
+    def respond(method, url, json):
+        return {
+            "embeddings": [
+                {"embedding": [float(text)], "index": i}
+                for i, text in enumerate(json["input"])
+            ]
+        }
+
+    mock_client.request.side_effect = respond
+    texts = [str(i) for i in range(5)]
+
+    result = Ollama.generate_embedding(
+        "test-model", texts, batch_size=2, max_concurrent_batches=2
+    )
+    assert [e.embedding for e in result.embeddings] == [[float(t)] for t in texts]
+    assert [e.index for e in result.embeddings] == list(range(5))
+    sent = sorted(
+        call[1]["json"]["input"] for call in mock_client.request.call_args_list
+    )
+    assert sent == [["0", "1"], ["2", "3"], ["4"]]
+
+    mock_client.request.side_effect = None
+    mock_client.request.return_value = respond("POST", "api/embed", {"input": texts})
+    assert Ollama.generate_embedding("test-model", texts) == result
+
+
+def test_generate_embedding_invalid_batch_size(mock_client):
+    """Test a non-positive batch size is rejected."""
+    with pytest.raises(ValueError, match="batch_size"):
+        Ollama.generate_embedding("test-model", ["a"], batch_size=0)
+
+
+def test_generate_embedding_return_numpy(mock_client):
+    """Test embeddings can be returned as a float32 numpy array."""
+    np = pytest.importorskip("numpy")
+    mock_client.request.return_value = {
+        "embeddings": [{"embedding": [0.1, 0.2]}, {"embedding": [0.3, 0.4]}]
     }
-    mock_client.request.return_value = mock_response
 
-    messages = [{"role": "user", "content": "Hello"}]
-    result = Ollama.chat("test-model", messages, stream=False)
-    assert result.message.content == "Hello!"
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "api/chat"
-    assert call_args[1]["json"]["model"] == "test-model"
-    assert call_args[1]["json"]["messages"] == messages
+    result = Ollama.generate_embedding("test-model", ["a", "b"], return_numpy=True)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float32
+    assert result.shape == (2, 2)
+
+    mock_client.request.return_value = {"embedding": [0.1, 0.2, 0.3]}
+    single = Ollama.generate_embedding("test-model", "a", return_numpy=True)
+    assert single.shape == (3,)
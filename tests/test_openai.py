@@ -1,157 +1,317 @@
-from unittest.mock import Mock, patch
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from sharpai_sdk.configuration import configure
+from sharpai_sdk.async_base import AsyncBaseClient
+from sharpai_sdk.base import BaseClient
+from sharpai_sdk.cache import InMemoryEmbeddingCache
+from sharpai_sdk.models.openai_models import (
+    OpenAIChatCompletionResponse,
+    OpenAICompletionResponse,
+    OpenAIEmbeddingResponse,
+)
+from sharpai_sdk.resources import openai as _openai_mod
 from sharpai_sdk.resources.openai import OpenAI
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_client():
-    """Create a mock client for testing."""
-    configure(endpoint="http://localhost:8000")
-    client = Mock()
-    with patch("sharpai_sdk.resources.openai.get_client", return_value=client):
+    """Create a mock client shared by the module."""
+    client = Mock(spec_set=BaseClient)
+    with patch.object(_openai_mod, "get_client", return_value=client):
         yield client
 
 
-def test_create_embedding_singular(mock_client):
-    """Test creating embedding for single input."""
-    mock_response = {
-        "object": "list",
-        "data": [{"object": "embedding", "embedding": [0.1, 0.2, 0.3], "index": 0}],
-        "model": "test-model",
-    }
-    mock_client.request.return_value = mock_response
+@pytest.fixture(scope="module")
+def mock_async_client():
+    """Create a mock async client shared by the module."""
+    client = Mock(spec_set=AsyncBaseClient)
+    client.request = AsyncMock()
+    with patch.object(_openai_mod, "aget_client", return_value=client):
+        yield client
 
-    result = OpenAI.create_embedding("test-model", "test input")
-    assert len(result.data) == 1
-    assert result.data[0].embedding == [0.1, 0.2, 0.3]
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "v1/embeddings"
-    assert call_args[1]["json"]["model"] == "test-model"
-    assert call_args[1]["json"]["input"] == "test input"
 
+@pytest.fixture(autouse=True)
+def _reset_mock_client(mock_client, mock_async_client):
+    """Reset the shared mock clients after each test."""
+    yield
+    mock_client.request.reset_mock(return_value=True, side_effect=True)
+    mock_async_client.request.reset_mock(return_value=True, side_effect=True)
 
-def test_create_embedding_multiple(mock_client):
-    """Test creating embeddings for multiple inputs."""
-    mock_response = {
-        "object": "list",
-        "data": [
-            {"object": "embedding", "embedding": [0.1, 0.2], "index": 0},
-            {"object": "embedding", "embedding": [0.3, 0.4], "index": 1},
-        ],
-        "model": "test-model",
-    }
-    mock_client.request.return_value = mock_response
 
-    result = OpenAI.create_embedding("test-model", ["input1", "input2"])
-    assert len(result.data) == 2
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[1]["json"]["input"] == ["input1", "input2"]
+_EMBEDDING_RESPONSE = {
+    "object": "list",
+    "data": [{"object": "embedding", "embedding": [0.1, 0.2, 0.3], "index": 0}],
+    "model": "test-model",
+}
+_EMBEDDINGS_RESPONSE = {
+    "object": "list",
+    "data": [
+        {"object": "embedding", "embedding": [0.1, 0.2], "index": 0},
+        {"object": "embedding", "embedding": [0.3, 0.4], "index": 1},
+    ],
+    "model": "test-model",
+}
+_COMPLETION_RESPONSE = {
+    "id": "test-id",
+    "object": "text_completion",
+    "created": 1234567890,
+    "model": "test-model",
+    "choices": [{"text": "This is a completion", "index": 0, "finish_reason": "stop"}],
+}
+_CHAT_COMPLETION_RESPONSE = {
+    "id": "test-id",
+    "object": "chat.completion",
+    "created": 1234567890,
+    "model": "test-model",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello!"},
+            "finish_reason": "stop",
+        }
+    ],
+}
+_MESSAGES = [{"role": "user", "content": "Hello"}]
+
+
+@pytest.mark.parametrize(
+    "name, args, kwargs, response, expected, path, body",
+    [
+        pytest.param(
+            "create_embedding",
+            ("test-model", "test input"),
+            {},
+            _EMBEDDING_RESPONSE,
+            OpenAIEmbeddingResponse(**_EMBEDDING_RESPONSE),
+            "v1/embeddings",
+            {"model": "test-model", "input": "test input"},
+            id="create_embedding_singular",
+        ),
+        pytest.param(
+            "create_embedding",
+            ("test-model", ["input1", "input2"]),
+            {},
+            _EMBEDDINGS_RESPONSE,
+            OpenAIEmbeddingResponse(**_EMBEDDINGS_RESPONSE),
+            "v1/embeddings",
+            {"model": "test-model", "input": ["input1", "input2"]},
+            id="create_embedding_multiple",
+        ),
+        pytest.param(
+            "create_completion",
+            ("test-model", "test prompt"),
+            {"max_tokens": 100, "temperature": 0.7},
+            _COMPLETION_RESPONSE,
+            OpenAICompletionResponse(**_COMPLETION_RESPONSE),
+            "v1/completions",
+            {
+                "model": "test-model",
+                "prompt": "test prompt",
+                "max_tokens": 100,
+                "temperature": 0.7,
+                "n": 1,
+                "stream": False,
+            },
+            id="create_completion",
+        ),
+        pytest.param(
+            "create_chat_completion",
+            ("test-model", _MESSAGES),
+            {"max_tokens": 100, "temperature": 0.7},
+            _CHAT_COMPLETION_RESPONSE,
+            OpenAIChatCompletionResponse(**_CHAT_COMPLETION_RESPONSE),
+            "v1/chat/completions",
+            {
+                "model": "test-model",
+                "temperature": 0.7,
+                "n": 1,
+                "stream": False,
+                "max_tokens": 100,
+                "messages": _MESSAGES,
+            },
+            id="create_chat_completion",
+        ),
+    ],
+)
+def test_openai_dispatch(
+    mock_client, name, args, kwargs, response, expected, path, body
+):
+    """Test each method posts the expected body and parses the response."""
+    mock_client.request.return_value = response
+
+    result = getattr(OpenAI, name)(*args, **kwargs)
+    assert result == expected
+    mock_client.request.assert_called_once_with("POST", path, json=body)
+
+
+_ALL_COMPLETION_PARAMS = {
+    "model": "test-model",
+    "prompt": "test",
+    "max_tokens": 150,
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "n": 2,
+    "stream": False,
+    "presence_penalty": 0.5,
+    "frequency_penalty": 0.3,
+    "stop": ["END"],
+    "user": "user-123",
+    "seed": 42,
+}
 
 
-def test_create_completion(mock_client):
-    """Test creating a completion."""
-    mock_response = {
+def test_create_completion_with_all_params(mock_client):
+    """Test creating completion with all optional parameters."""
+    mock_client.request.return_value = _COMPLETION_RESPONSE
+
+    OpenAI.create_completion(**_ALL_COMPLETION_PARAMS)
+
+    json_data = mock_client.request.call_args[1]["json"]
+    assert json_data == _ALL_COMPLETION_PARAMS
+
+
+def test_acreate_chat_completion(mock_async_client):
+    """Test creating a chat completion asynchronously."""
+    mock_async_client.request.return_value = {
         "id": "test-id",
-        "object": "text_completion",
         "created": 1234567890,
         "model": "test-model",
         "choices": [
-            {
-                "text": "This is a completion",
-                "index": 0,
-                "finish_reason": "stop",
-            }
+            {"index": 0, "message": {"role": "assistant", "content": "Hello!"}}
         ],
     }
-    mock_client.request.return_value = mock_response
+    result = asyncio.run(OpenAI.acreate_chat_completion("test-model", _MESSAGES))
+    assert result.choices[0].message.content == "Hello!"
+    mock_async_client.request.assert_awaited_once_with(
+        "POST",
+        "v1/chat/completions",
+        json={"model": "test-model", "n": 1, "stream": False, "messages": _MESSAGES},
+    )
+
 
-    result = OpenAI.create_completion(
-        "test-model", "test prompt", max_tokens=100, temperature=0.7
+def test_create_chat_completion_stream(mock_client):
+    """Test streaming a chat completion parses SSE events until [DONE]."""
+    chunk = (
+        'data: {"id": "test-id", "created": 1234567890, "model": "test-model", '
+        '"choices": [{"index": 0, "delta": {"content": "%s"}}]}'
     )
-    assert len(result.choices) == 1
-    assert result.choices[0].text == "This is a completion"
-    mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "v1/completions"
-    assert call_args[1]["json"]["model"] == "test-model"
-    assert call_args[1]["json"]["prompt"] == "test prompt"
-    assert call_args[1]["json"]["max_tokens"] == 100
-    assert call_args[1]["json"]["temperature"] == 0.7
-
-
-def test_create_chat_completion(mock_client):
-    """Test creating a chat completion."""
-    mock_response = {
-        "id": "test-id",
-        "object": "chat.completion",
-        "created": 1234567890,
+    lines = [chunk % "Hel", "", ": keep-alive", chunk % "lo", "data: [DONE]"]
+    response = Mock()
+    response.iter_lines.return_value = iter(lines)
+
+    @contextmanager
+    def stream(method, url, **kwargs):
+        assert (method, url) == ("POST", "v1/chat/completions")
+        yield response
+
+    with patch.object(mock_client, "stream", stream):
+        chunks = list(
+            OpenAI.create_chat_completion("test-model", _MESSAGES, stream=True)
+        )
+    assert [c.choices[0].delta.content for c in chunks] == ["Hel", "lo"]
+
+
+def test_create_embedding_uses_cache(mock_client):
+    """Test repeated embedding inputs are served from the cache."""
+    cache = InMemoryEmbeddingCache()
+    mock_client.request.return_value = {
+        "data": [{"embedding": [0.1, 0.2], "index": 0}],
         "model": "test-model",
-        "choices": [
-            {
-                "index": 0,
-                "message": {"role": "assistant", "content": "Hello!"},
-                "finish_reason": "stop",
-            }
-        ],
     }
-    mock_client.request.return_value = mock_response
 
-    messages = [{"role": "user", "content": "Hello"}]
-    result = OpenAI.create_chat_completion(
-        "test-model", messages, max_tokens=100, temperature=0.7
-    )
-    assert len(result.choices) == 1
-    assert result.choices[0].message.content == "Hello!"
+    with patch("sharpai_sdk.resources.openai.get_embedding_cache", return_value=cache):
+        first = OpenAI.create_embedding("test-model", "Hello")
+        second = OpenAI.create_embedding("test-model", ["Hello"])
+
+    assert first.data[0].embedding == [0.1, 0.2]
+    assert second.data[0].embedding == [0.1, 0.2]
+    assert second.model == "test-model"
     mock_client.request.assert_called_once()
-    call_args = mock_client.request.call_args
-    assert call_args[0][0] == "POST"
-    assert call_args[0][1] == "v1/chat/completions"
-    assert call_args[1]["json"]["model"] == "test-model"
-    assert call_args[1]["json"]["messages"] == messages
-    assert call_args[1]["json"]["max_tokens"] == 100
 
 
-def test_create_completion_with_all_params(mock_client):
-    """Test creating completion with all optional parameters."""
-    mock_response = {
-        "id": "test-id",
-        "object": "text_completion",
-        "created": 1234567890,
+def test_acreate_embedding_batches_large_input(mock_async_client):
+    """Test oversized lists are sent as concurrent batches and reassembled."""
+
+    async def respond(method, url, json):
+        return {
+            "data": [
+                {"embedding": [float(text)], "index": i}
+                for i, text in enumerate(json["input"])
+            ],
+            "model": "test-model",
+            "usage": {"prompt_tokens": len(json["input"]), "total_tokens": 1},
+        }
+
+    mock_async_client.request.side_effect = respond
+    texts = [str(i) for i in range(5)]
+
+    result = asyncio.run(OpenAI.acreate_embedding("test-model", texts, batch_size=2))
+    assert [item.embedding for item in result.data] == [[float(t)] for t in texts]
+    assert result.usage == {"prompt_tokens": 5, "total_tokens": 3}
+    assert mock_async_client.request.call_count == 3
+
+
+def test_create_embedding_merges_nested_usage(mock_client):
+    """Test usage from several batches is summed, including nested counts."""
+
+    def respond(method, url, json):
+        return {
+            "data": [{"embedding": [float(len(json["input"]))], "index": 0}],
+            "model": "test-model",
+            "usage": {
+                "prompt_tokens": 2,
+                "total_tokens": 2,
+                "prompt_tokens_details": {"cached_tokens": 1},
+            },
+        }
+
+    mock_client.request.side_effect = respond
+
+    result = OpenAI.create_embedding("x", ["a", "b", "c"], batch_size=1)
+    assert result.usage == {
+        "prompt_tokens": 6,
+        "total_tokens": 6,
+        "prompt_tokens_details": {"cached_tokens": 3},
+    }
+
+
+def test_create_embedding_same_shape_when_batched(mock_client):
+    """Test batched and unbatched requests return the same response."""
+
+    def respond(method, url, json):
+        return {
+            "object": "list",
+            "data": [
+                {"object": "embedding", "embedding": [float(text)], "index": i}
+                for i, text in reversed(list(enumerate(json["input"])))
+            ],
+            "model": "test-model",
+            "usage": {"prompt_tokens": len(json["input"])},
+        }
+
+    mock_client.request.side_effect = respond
+    texts = [str(i) for i in range(4)]
+
+    unbatched = OpenAI.create_embedding("test-model", texts, batch_size=4)
+    batched = OpenAI.create_embedding("test-model", texts, batch_size=3)
+    assert batched == unbatched
+    assert [item.index for item in unbatched.data] == list(range(4))
+
+
+def test_create_embedding_return_numpy(mock_client):
+    """Test embeddings are returned as a float32 array in index order."""
+    np = pytest.importorskip("numpy")
+    mock_client.request.return_value = {
+        "data": [
+            {"embedding": [0.3, 0.4], "index": 1},
+            {"embedding": [0.1, 0.2], "index": 0},
+        ],
         "model": "test-model",
-        "choices": [{"text": "test", "index": 0}],
     }
-    mock_client.request.return_value = mock_response
-
-    _ = OpenAI.create_completion(
-        model="test-model",
-        prompt="test",
-        max_tokens=150,
-        temperature=0.7,
-        top_p=0.9,
-        n=2,
-        stream=False,
-        presence_penalty=0.5,
-        frequency_penalty=0.3,
-        stop=["END"],
-        user="user-123",
-        seed=42,
-    )
 
-    call_args = mock_client.request.call_args
-    json_data = call_args[1]["json"]
-    assert json_data["max_tokens"] == 150
-    assert json_data["temperature"] == 0.7
-    assert json_data["top_p"] == 0.9
-    assert json_data["n"] == 2
-    assert json_data["presence_penalty"] == 0.5
-    assert json_data["frequency_penalty"] == 0.3
-    assert json_data["stop"] == ["END"]
-    assert json_data["user"] == "user-123"
-    assert json_data["seed"] == 42
+    result = OpenAI.create_embedding("test-model", ["a", "b"], return_numpy=True)
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, [[0.1, 0.2], [0.3, 0.4]])
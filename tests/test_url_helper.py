@@ -0,0 +1,53 @@
+from urllib.parse import urlencode
+
+import pytest
+
+from sharpai_sdk.utils.url_helper import (
+    _base_url_v1,
+    _base_url_v2,
+    _get_url_v1,
+    _get_url_v2,
+    _resource_url_v1,
+)
+
+
+class Resource:
+    RESOURCE_NAME = "nodes"
+
+
+class Unnamed:
+    RESOURCE_NAME = ""
+
+
+def test_base_urls_are_cached():
+    """Test base URLs are built once per class and segments."""
+    assert _base_url_v1(Resource) == "v1.0/nodes"
+    assert _base_url_v1(Resource, "bulk") == "v1.0/nodes/bulk"
+    assert _base_url_v1(Resource) is _base_url_v1(Resource)
+    assert _base_url_v2(Resource) == _get_url_v2(Resource) == "v2.0/nodes"
+
+
+@pytest.mark.parametrize("cls", [Resource, Unnamed])
+@pytest.mark.parametrize("guid", [None, "", "abc-123"])
+@pytest.mark.parametrize("flags", [(), ("incldata",), ("incldata", "inclsub")])
+def test_resource_url_matches_get_url(cls, guid, flags):
+    """Test the cached resource URL matches the generic URL builder."""
+    expected = _get_url_v1(cls, guid, **{flag: None for flag in flags})
+    assert _resource_url_v1(cls, guid, flags) == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"maxResults": 100, "token": "abc-123"},
+        {"q": "hello world & more", "path": "a/b?c=d"},
+        {"name": "café", "raw": b"x y"},
+        {"enabled": True, "incldata": None},
+    ],
+)
+def test_query_params_match_urlencode(params):
+    """Test query parameters are encoded exactly like urlencode."""
+    values = {k: v for k, v in params.items() if v is not None}
+    flags = [k for k, v in params.items() if v is None]
+    expected = "&".join(filter(None, [urlencode(values), "&".join(flags)]))
+    assert _get_url_v1(Resource, **params) == f"v1.0/nodes?{expected}"